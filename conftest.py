@@ -0,0 +1,34 @@
+"""
+Shared pytest fixtures
+"""
+
+import sys
+import os
+import tempfile
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pytest
+
+from contact_manager.database.manager import db_manager
+from contact_manager.database.adapters.sqlite_adapter import SQLiteAdapter
+from contact_manager.core.schema_manager import schema_manager
+
+
+@pytest.fixture
+def sqlite_db():
+    """Point db_manager at a fresh SQLite database for the duration of a test."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        adapter = SQLiteAdapter({'path': os.path.join(tmp_dir, 'contacts.db')})
+        adapter.create_table()
+        adapter.ensure_indexes()
+
+        previous = db_manager._current_adapter
+        db_manager._current_adapter = adapter
+        schema_manager.invalidate_column_cache()
+        try:
+            yield adapter
+        finally:
+            db_manager._current_adapter = previous
+            schema_manager.invalidate_column_cache()
@@ -8,6 +8,8 @@ db = db.getSiblingDB('contacts');
 // Create indexes for better performance
 db.contacts.createIndex({ "name": 1 });
 db.contacts.createIndex({ "email": 1 });
+// Case-insensitive email index used by duplicate checks
+db.contacts.createIndex({ "email": 1 }, { name: "email_ci", collation: { locale: "en", strength: 2 } });
 db.contacts.createIndex({ "phone": 1 });
 db.contacts.createIndex({ "created_at": 1 });
 db.contacts.createIndex({ "updated_at": 1 });
@@ -13,4 +13,9 @@ CREATE TABLE IF NOT EXISTS contacts (
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
 );
 
+-- Indexes for commonly searched columns
+CREATE INDEX idx_contacts_name ON contacts (name);
+CREATE INDEX idx_contacts_email ON contacts (email(64));
+CREATE INDEX idx_contacts_phone ON contacts (phone);
+
 -- Table created successfully - no sample data inserted
@@ -9,6 +9,11 @@ CREATE TABLE IF NOT EXISTS contacts (
     updated_at TIMESTAMP DEFAULT (NOW() AT TIME ZONE 'UTC')
 );
 
+-- Indexes for commonly searched columns
+CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts (name);
+CREATE INDEX IF NOT EXISTS idx_contacts_email_lower ON contacts (LOWER(email));
+CREATE INDEX IF NOT EXISTS idx_contacts_phone ON contacts (phone);
+
 -- Create trigger to automatically update updated_at column with UTC timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -38,6 +38,10 @@ class ContactManagerApp:
             create_table()
             self._validate_and_repair_table_structure()
             
+            # Index the columns used by search and duplicate checks
+            from .core.schema_manager import SchemaManager
+            SchemaManager.ensure_indexes()
+            
             self._initialized = True
             return True
             
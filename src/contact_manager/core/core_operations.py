@@ -12,6 +12,10 @@ import shutil
 import datetime
 import os
 
+# Validation patterns, compiled once at import time
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+_NON_DIGIT_RE = re.compile(r'\D')
+
 class ContactDatabase:
     """Core database operations for contact management."""
     
@@ -399,14 +403,19 @@ class DataValidator:
     @staticmethod
     def validate_email(email):
         """Validate email format."""
-        pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        return re.match(pattern, email) is not None
+        return _EMAIL_RE.fullmatch(email) is not None
+    
+    @staticmethod
+    def validate_emails(emails):
+        """Validate many email addresses at once. Returns a list of booleans."""
+        fullmatch = _EMAIL_RE.fullmatch
+        return [fullmatch(email) is not None for email in emails]
     
     @staticmethod
     def validate_phone(phone):
         """Validate phone number format."""
         # Remove all non-digit characters
-        digits = re.sub(r'\D', '', phone)
+        digits = _NON_DIGIT_RE.sub('', phone)
         # Check if it has 7-15 digits
         return 7 <= len(digits) <= 15
     
@@ -414,8 +423,22 @@ class DataValidator:
     def format_phone(phone):
         """Format phone number consistently."""
         # Remove all non-digit characters
-        digits = re.sub(r'\D', '', phone)
-        
+        return DataValidator._format_digits(phone, _NON_DIGIT_RE.sub('', phone))
+    
+    @staticmethod
+    def validate_and_format_phone(phone):
+        """Validate and format a phone number from one pass over its digits.
+        
+        Returns the formatted number, or None if the number is invalid.
+        """
+        digits = _NON_DIGIT_RE.sub('', phone)
+        if not 7 <= len(digits) <= 15:
+            return None
+        return DataValidator._format_digits(phone, digits)
+    
+    @staticmethod
+    def _format_digits(phone, digits):
+        """Format a phone number given its extracted digits."""
         if len(digits) == 10:
             return f"({digits[:3]}) {digits[3:6]}-{digits[6:]}"
         elif len(digits) == 11 and digits[0] == '1':
@@ -446,10 +469,9 @@ class DataIntegrity:
         # Check for invalid emails
         cursor.execute("SELECT id, email FROM contacts WHERE email IS NOT NULL AND email != ''")
         contacts_with_email = cursor.fetchall()
-        invalid_emails = []
-        for contact_id, email in contacts_with_email:
-            if not DataValidator.validate_email(email):
-                invalid_emails.append((contact_id, email))
+        email_checks = DataValidator.validate_emails(email for _, email in contacts_with_email)
+        invalid_emails = [contact for contact, is_valid in zip(contacts_with_email, email_checks)
+                          if not is_valid]
         
         if invalid_emails:
             issues.append(f"Invalid email formats found: {invalid_emails}")
@@ -466,6 +488,12 @@ class DataIntegrity:
 
 # Import database manager for multi-database support
 from ..database.manager import db_manager
+from .schema_manager import schema_manager
+from ..utils.ttl_cache import TTLCache
+
+# Seconds analytics/statistics are reused; any recorded change or database switch refreshes them sooner
+STATS_CACHE_TTL = 30
+_stats_cache = TTLCache(ttl=STATS_CACHE_TTL)
 
 # Create a default instance for backward compatibility
 # Now uses the database manager which handles database switching
@@ -479,11 +507,11 @@ def create_table():
 
 def add_contact(**fields):
     """Add contact with dynamic fields."""
-    return db_manager.current_adapter.add_contact(**fields)
+    return db_manager.add_contact(**fields)
 
 def update_contact(contact_id, **fields):
     """Update contact with dynamic fields."""
-    return db_manager.current_adapter.update_contact(contact_id, **fields)
+    return db_manager.update_contact(contact_id, **fields)
 
 def view_contacts():
     return db_manager.current_adapter.view_contacts()
@@ -492,16 +520,25 @@ def get_contact_by_id(contact_id):
     return db_manager.current_adapter.get_contact_by_id(contact_id)
 
 def update_contact_name(contact_id, new_name):
-    return db_manager.current_adapter.update_contact_name(contact_id, new_name)
+    try:
+        return db_manager.current_adapter.update_contact_name(contact_id, new_name)
+    finally:
+        db_manager.mark_modified()
 
 def update_contact_phone(contact_id, new_phone):
-    return db_manager.current_adapter.update_contact_phone(contact_id, new_phone)
+    try:
+        return db_manager.current_adapter.update_contact_phone(contact_id, new_phone)
+    finally:
+        db_manager.mark_modified()
 
 def update_contact_email(contact_id, new_email):
-    return db_manager.current_adapter.update_contact_email(contact_id, new_email)
+    try:
+        return db_manager.current_adapter.update_contact_email(contact_id, new_email)
+    finally:
+        db_manager.mark_modified()
 
 def delete_contact(contact_id):
-    return db_manager.current_adapter.delete_contact(contact_id)
+    return db_manager.delete_contact(contact_id)
 
 def search_contact(search_term):
     return db_manager.current_adapter.search_contact(search_term)
@@ -509,6 +546,10 @@ def search_contact(search_term):
 def advanced_search(filters):
     return db_manager.current_adapter.advanced_search(filters)
 
+def iter_advanced_search(filters):
+    """Advanced search yielding rows lazily instead of building a list."""
+    return db_manager.current_adapter.iter_advanced_search(filters)
+
 def export_to_csv(filename=None):
     if filename is None:
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -522,41 +563,74 @@ def export_to_json(filename=None):
     return db_manager.current_adapter.export_to_json(filename)
 
 def import_from_csv(filename):
-    return db_manager.current_adapter.import_from_csv(filename)
+    try:
+        return db_manager.current_adapter.import_from_csv(filename)
+    finally:
+        db_manager.mark_modified()
 
 def bulk_update(contact_ids, field, new_value):
-    return db_manager.current_adapter.bulk_update(contact_ids, field, new_value)
+    try:
+        return db_manager.current_adapter.bulk_update(contact_ids, field, new_value)
+    finally:
+        db_manager.mark_modified()
 
 def bulk_delete(contact_ids):
-    return db_manager.current_adapter.bulk_delete(contact_ids)
+    try:
+        return db_manager.current_adapter.bulk_delete(contact_ids)
+    finally:
+        db_manager.mark_modified()
 
 def get_contact_analytics():
-    return db_manager.current_adapter.get_contact_analytics()
+    adapter = db_manager.current_adapter
+    return _stats_cache.get('analytics', adapter.get_contact_analytics, db_manager.data_version)
 
 def get_database_stats():
-    return db_manager.current_adapter.get_database_stats()
+    adapter = db_manager.current_adapter
+    return _stats_cache.get('database_stats', adapter.get_database_stats, db_manager.data_version)
+
+def invalidate_stats_cache():
+    """Forget cached analytics and statistics (e.g. after writing through an adapter directly)."""
+    _stats_cache.invalidate()
 
 def get_table_info():
-    return db_manager.current_adapter.get_table_info()
+    return schema_manager.get_table_info()
 
 def add_column(column_name, column_type, default_value=None):
-    return db_manager.current_adapter.add_column(column_name, column_type, default_value)
+    try:
+        return db_manager.current_adapter.add_column(column_name, column_type, default_value)
+    finally:
+        schema_manager.invalidate_column_cache()
 
 def backup_database():
     return db_manager.current_adapter.backup_database()
 
 def restore_database(backup_filename):
-    return db_manager.current_adapter.restore_database(backup_filename)
+    try:
+        return db_manager.current_adapter.restore_database(backup_filename)
+    finally:
+        db_manager.mark_modified()
+        schema_manager.invalidate_column_cache()
 
 def cleanup_db():
-    return db_manager.current_adapter.cleanup_db()
+    try:
+        return db_manager.current_adapter.cleanup_db()
+    finally:
+        db_manager.mark_modified()
 
 def full_cleanup_db():
-    return db_manager.current_adapter.full_cleanup_db()
+    try:
+        return db_manager.current_adapter.full_cleanup_db()
+    finally:
+        db_manager.mark_modified()
+        schema_manager.invalidate_column_cache()
 
 def reset_table_structure():
     """Reset table to base 4-column structure (deletes table and recreates)."""
-    return db_manager.current_adapter.reset_table_structure()
+    try:
+        return db_manager.current_adapter.reset_table_structure()
+    finally:
+        db_manager.mark_modified()
+        schema_manager.invalidate_column_cache()
 
 def validate_email(email):
     return validator.validate_email(email)
@@ -567,6 +641,9 @@ def validate_phone(phone):
 def format_phone(phone):
     return validator.format_phone(phone)
 
+def validate_and_format_phone(phone):
+    return validator.validate_and_format_phone(phone)
+
 def check_data_integrity():
     integrity_checker = DataIntegrity(db_manager.current_adapter)
     return integrity_checker.check_data_integrity()
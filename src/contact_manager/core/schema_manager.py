@@ -3,7 +3,16 @@ Schema Manager - Dynamic Database Schema Management
 Handles dynamic column introspection and schema modifications across all database types.
 """
 
-from typing import List, Dict, Any, Tuple
+from collections import namedtuple
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+
+
+@lru_cache(maxsize=16)
+def _contact_type(columns: Tuple[str, ...]):
+    """Build the record type for contact rows, once per distinct schema."""
+    # rename=True swaps column names that aren't valid field names for _<index>
+    return namedtuple('Contact', columns, rename=True)
 
 
 class SchemaManager:
@@ -12,11 +21,48 @@ class SchemaManager:
     # Minimum required columns (cannot be removed)
     REQUIRED_COLUMNS = ['id', 'name', 'phone', 'email', 'created_at', 'updated_at']
     
+    # (adapter, columns) from the last introspection; cleared whenever the schema changes
+    _columns_cache: Optional[Tuple[Any, Tuple[str, ...]]] = None
+    # (adapter, table info rows) from the last introspection; cleared together with the columns
+    _table_info_cache: Optional[Tuple[Any, Tuple[tuple, ...]]] = None
+    
+    @staticmethod
+    def invalidate_column_cache() -> None:
+        """Forget the cached column list and table info (call after any schema change)."""
+        SchemaManager._columns_cache = None
+        SchemaManager._table_info_cache = None
+    
+    @staticmethod
+    def get_table_info() -> List[Tuple]:
+        """Get the adapter's table info rows.
+        
+        The result is cached per adapter until invalidate_column_cache() is called;
+        an empty result (e.g. the table does not exist yet) is not cached.
+        """
+        from ..database.manager import db_manager
+        adapter = db_manager.current_adapter
+        cached = SchemaManager._table_info_cache
+        if cached is not None and cached[0] is adapter:
+            return list(cached[1])
+        
+        table_info = adapter.get_table_info()
+        if table_info:
+            SchemaManager._table_info_cache = (adapter, tuple(tuple(col) for col in table_info))
+        return table_info
+    
     @staticmethod
     def get_table_columns() -> List[str]:
-        """Get list of all column names in the contacts table."""
+        """Get list of all column names in the contacts table.
+        
+        The result is cached per adapter until invalidate_column_cache() is called.
+        """
         from ..database.manager import db_manager
-        table_info = db_manager.current_adapter.get_table_info()
+        adapter = db_manager.current_adapter
+        cached = SchemaManager._columns_cache
+        if cached is not None and cached[0] is adapter:
+            return list(cached[1])
+        
+        table_info = SchemaManager.get_table_info()
         
         # Handle different return formats from different databases
         if not table_info:
@@ -40,12 +86,21 @@ class SchemaManager:
                     col_name = col_info[0]
                 columns.append(str(col_name))
         
-        return columns if columns else SchemaManager.REQUIRED_COLUMNS.copy()
+        if not columns:
+            return SchemaManager.REQUIRED_COLUMNS.copy()
+        
+        SchemaManager._columns_cache = (adapter, tuple(columns))
+        return columns
     
     @staticmethod
-    def get_display_columns() -> List[str]:
-        """Get columns in proper display order with timestamps last."""
-        columns = SchemaManager.get_table_columns()
+    def get_display_columns(columns: Optional[List[str]] = None) -> List[str]:
+        """Get columns in proper display order with timestamps last.
+        
+        Args:
+            columns: Table columns to order (fetched from the database if omitted)
+        """
+        if columns is None:
+            columns = SchemaManager.get_table_columns()
         
         # Separate timestamp columns from others
         timestamp_cols = ['created_at', 'updated_at']
@@ -59,7 +114,7 @@ class SchemaManager:
     def get_column_info() -> List[Dict[str, Any]]:
         """Get detailed information about all columns."""
         from ..database.manager import db_manager
-        table_info = db_manager.current_adapter.get_table_info()
+        table_info = SchemaManager.get_table_info()
         columns_info = []
         
         for col_info in table_info:
@@ -141,12 +196,26 @@ class SchemaManager:
             
             # Add column using adapter
             from ..database.manager import db_manager
-            db_manager.current_adapter.add_column(column_name, column_type, default_value)
+            try:
+                db_manager.current_adapter.add_column(column_name, column_type, default_value)
+            finally:
+                SchemaManager.invalidate_column_cache()
             return True
         except Exception as e:
             print(f"Error adding column: {e}")
             return False
     
+    @staticmethod
+    def ensure_indexes() -> bool:
+        """Create indexes for the commonly searched columns if they are missing."""
+        try:
+            from ..database.manager import db_manager
+            db_manager.current_adapter.ensure_indexes()
+            return True
+        except Exception as e:
+            print(f"Error creating indexes: {e}")
+            return False
+    
     @staticmethod
     def remove_column(column_name: str) -> bool:
         """Remove a column from the contacts table."""
@@ -163,7 +232,10 @@ class SchemaManager:
             # Remove column using adapter
             from ..database.manager import db_manager
             if hasattr(db_manager.current_adapter, 'remove_column'):
-                db_manager.current_adapter.remove_column(column_name)
+                try:
+                    db_manager.current_adapter.remove_column(column_name)
+                finally:
+                    SchemaManager.invalidate_column_cache()
                 return True
             else:
                 print("Current database adapter doesn't support column removal")
@@ -196,6 +268,27 @@ class SchemaManager:
         
         return contact_dict
     
+    @staticmethod
+    def get_contact(contact_tuple: Tuple, columns: Optional[List[str]] = None) -> Tuple:
+        """Wrap a contact tuple in a record with one attribute per column.
+        
+        Lighter than get_contact_as_dict for filtering many rows: values are raw
+        database values (timestamps are not formatted) and the record type is
+        built once per schema.
+        
+        Args:
+            contact_tuple: Row as returned by the adapter
+            columns: Table columns (fetched from the database if omitted)
+        """
+        if columns is None:
+            columns = SchemaManager.get_table_columns()
+        
+        values = tuple(contact_tuple)
+        if len(values) != len(columns):
+            # Pad short rows with None and drop any extra values
+            values = (values + (None,) * len(columns))[:len(columns)]
+        return _contact_type(tuple(columns))._make(values)
+    
     @staticmethod
     def get_contact_as_dict_raw(contact_tuple: Tuple) -> Dict[str, Any]:
         """Convert contact tuple to dictionary with raw database values (no formatting)."""
@@ -8,6 +8,9 @@ from typing import List, Dict, Any
 from ..database.manager import db_manager
 from ..core.schema_manager import schema_manager
 
+# Maximum contacts sent to the database in a single bulk insert
+INSERT_BATCH_SIZE = 500
+
 class DummyDataGenerator:
     """Generate realistic dummy contact data."""
     
@@ -200,22 +203,27 @@ class DummyDataGenerator:
             if show_progress and len(contacts) > 20:
                 print("📝 Inserting contacts into database...")
             
-            for i, contact in enumerate(contacts, 1):
+            # Insert in batches (one round trip each); progress is reported whenever
+            # a batch crosses a 10% step
+            batch_size = min(INSERT_BATCH_SIZE, progress_interval)
+            for start in range(0, len(contacts), batch_size):
+                batch = [{"name": contact["name"], "phone": contact["phone"], "email": contact["email"]}
+                         for contact in contacts[start:start + batch_size]]
                 try:
-                    db_manager.current_adapter.add_contact(
-                        name=contact["name"],
-                        phone=contact["phone"],
-                        email=contact["email"]
-                    )
-                    inserted_count += 1
-                    
-                    # Show progress for large datasets
-                    if show_progress and len(contacts) > 50 and i % progress_interval == 0:
-                        percentage = (i / len(contacts)) * 100
-                        print(f"   ⏳ Progress: {i}/{len(contacts)} ({percentage:.0f}%)")
-                        
+                    batch_inserted = db_manager.add_contacts_bulk(batch)
+                    inserted_count += batch_inserted
+                    if batch_inserted < len(batch):
+                        errors.append(f"Only {batch_inserted} of contacts {start + 1}-{start + len(batch)} "
+                                      f"were inserted")
                 except Exception as e:
-                    errors.append(f"Failed to insert {contact['name']}: {str(e)}")
+                    errors.append(f"Failed to insert contacts {start + 1}-{start + len(batch)}: {str(e)}")
+                
+                # Show progress for large datasets
+                done = start + len(batch)
+                if (show_progress and len(contacts) > 50
+                        and done // progress_interval > start // progress_interval):
+                    percentage = (done / len(contacts)) * 100
+                    print(f"   ⏳ Progress: {done}/{len(contacts)} ({percentage:.0f}%)")
             
             return {
                 "success": True,
@@ -3,20 +3,29 @@ MongoDB database adapter using pymongo.
 """
 
 from pymongo import MongoClient
+from pymongo.errors import BulkWriteError, PyMongoError
 from bson.objectid import ObjectId
 import csv
 import json
 import datetime
 import os
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 from ..base import DatabaseAdapter
 from ...core.schema_manager import schema_manager
+from ...utils.normalization import NORMALIZED_FIELDS, normalize_contact_fields, normalize_field_value
+
+# Case-insensitive (but accent-sensitive) collation for email lookups and their index.
+# It still equates some strings str.lower() keeps apart (e.g. 'ß' and 'ss'), so
+# matches are re-checked in Python.
+EMAIL_COLLATION = {'locale': 'en', 'strength': 2}
 
 
 class MongoDBAdapter(DatabaseAdapter):
     """MongoDB implementation of the DatabaseAdapter interface."""
     
+    error_types = (PyMongoError, ConnectionError)
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize MongoDB adapter with configuration."""
         super().__init__(config)
@@ -83,11 +92,35 @@ class MongoDBAdapter(DatabaseAdapter):
         self.collection.create_index("created_at")  # Add timestamp index
         self.collection.create_index("updated_at")  # Add timestamp index
         
+        self.ensure_indexes()
+        
         # Initialize counter if not exists
         counters = self.db['counters']
         if counters.find_one({'_id': 'contact_id'}) is None:
             counters.insert_one({'_id': 'contact_id', 'sequence_value': 0})
     
+    def ensure_indexes(self) -> None:
+        """Create the case-insensitive email index used by duplicate checks if it doesn't exist."""
+        if self.collection is None:
+            raise ConnectionError("MongoDB not initialized")
+        
+        # Sits next to the plain email index; queries only use it when they pass the same collation
+        self.collection.create_index("email", name="email_ci", collation=EMAIL_COLLATION)
+    
+    def normalize_stored_values(self) -> int:
+        """Strip whitespace from stored emails/phones written before write-time normalization."""
+        if self.collection is None:
+            raise ConnectionError("MongoDB not initialized")
+        
+        updated_count = 0
+        for field in NORMALIZED_FIELDS:
+            result = self.collection.update_many(
+                {field: {'$regex': r'^\s|\s$'}},
+                [{'$set': {field: {'$trim': {'input': f'${field}'}}}}]
+            )
+            updated_count += result.modified_count
+        return updated_count
+    
     def _get_next_id(self) -> int:
         """Get next auto-increment ID for contacts."""
         counters = self.db['counters']
@@ -99,16 +132,18 @@ class MongoDBAdapter(DatabaseAdapter):
         )
         return result['sequence_value']
     
-    def _doc_to_tuple(self, doc: Dict) -> Tuple:
+    def _doc_to_tuple(self, doc: Dict, column_names: Optional[List[str]] = None) -> Tuple:
         """Convert MongoDB document to tuple format for compatibility.
-        Order aligns with get_table_info() column order.
+        Order aligns with get_table_info() column order; pass column_names
+        to reuse them across many documents.
         """
         if doc is None:
             return None
         
-        # Derive current visible columns (exclude internal fields)
-        columns_info = self.get_table_info()
-        column_names = [c[0] for c in columns_info]
+        if column_names is None:
+            # Derive current visible columns (exclude internal fields)
+            columns_info = self.get_table_info()
+            column_names = [c[0] for c in columns_info]
         
         values: List[Any] = []
         for col in column_names:
@@ -134,12 +169,50 @@ class MongoDBAdapter(DatabaseAdapter):
         }
         
         # Add all provided fields (but don't override timestamps if passed)
-        for key, value in fields.items():
+        for key, value in normalize_contact_fields(fields).items():
             if key not in ['created_at', 'updated_at']:  # Don't override timestamps
                 contact[key] = value
         
         self.collection.insert_one(contact)
     
+    def add_contacts_bulk(self, records: List[Dict[str, Any]]) -> int:
+        """Add many contacts with a single insert_many. Returns number of inserted contacts.
+        
+        The insert is unordered, so a failing document doesn't stop the rest;
+        the documents that were written are still counted.
+        """
+        if not records:
+            return 0
+        if any('name' not in record for record in records):
+            raise ValueError("Name is required")
+        
+        if self.collection is None:
+            raise ConnectionError("MongoDB not initialized")
+        
+        # Reserve a contiguous block of IDs in one counter update
+        counter = self.db['counters'].find_one_and_update(
+            {'_id': 'contact_id'},
+            {'$inc': {'sequence_value': len(records)}},
+            return_document=True,
+            upsert=True
+        )
+        first_id = counter['sequence_value'] - len(records) + 1
+        
+        now = datetime.datetime.utcnow()
+        contacts = []
+        for contact_id, record in enumerate(records, first_id):
+            contact = {'id': contact_id, 'created_at': now, 'updated_at': now}
+            for key, value in normalize_contact_fields(record).items():
+                if key not in ['created_at', 'updated_at']:  # Don't override timestamps
+                    contact[key] = value
+            contacts.append(contact)
+        
+        try:
+            result = self.collection.insert_many(contacts, ordered=False)
+        except BulkWriteError as e:
+            return e.details.get('nInserted', 0)
+        return len(result.inserted_ids)
+    
     def view_contacts(self) -> List[Tuple]:
         """Retrieve all contacts from the database."""
         if self.collection is None:
@@ -166,7 +239,7 @@ class MongoDBAdapter(DatabaseAdapter):
         
         # Prepare update fields (don't allow overriding created_at)
         update_fields = {}
-        for key, value in fields.items():
+        for key, value in normalize_contact_fields(fields).items():
             if key != 'created_at':  # Never update created_at
                 update_fields[key] = value
         
@@ -214,11 +287,44 @@ class MongoDBAdapter(DatabaseAdapter):
         docs = self.collection.find(query).sort('id', 1)
         return [self._doc_to_tuple(doc) for doc in docs]
     
-    def advanced_search(self, filters: Dict[str, Any]) -> List[Tuple]:
-        """Advanced search with multiple filters (OR condition)."""
+    def find_contact_by_email(self, email: str, exclude_id: Optional[int] = None) -> Optional[int]:
+        """Return the ID of the first contact using this email (case-insensitive), or None.
+        
+        The collated equality uses the email_ci index to find candidates; only
+        those equal to the email under str.lower() count, as on the SQL databases.
+        """
+        if self.collection is None:
+            raise ConnectionError("MongoDB not initialized")
+        
+        email = email.strip()
+        lowered = email.lower()
+        query: Dict[str, Any] = {'email': email}
+        if exclude_id:
+            query['id'] = {'$ne': exclude_id}
+        candidates = self.collection.find(query, {'id': 1, 'email': 1},
+                                          collation=EMAIL_COLLATION).sort('id', 1)
+        for doc in candidates:
+            stored = doc.get('email')
+            if isinstance(stored, str) and stored.lower() == lowered:
+                return doc['id']
+        return None
+    
+    def find_contact_by_phone(self, phone: str, exclude_id: Optional[int] = None) -> Optional[int]:
+        """Return the ID of the first contact using this phone number, or None."""
+        return self._find_contact_id({'phone': phone.strip()}, exclude_id)
+    
+    def _find_contact_id(self, query: Dict[str, Any], exclude_id: Optional[int]) -> Optional[int]:
+        """Return the lowest contact ID matching the query."""
         if self.collection is None:
             raise ConnectionError("MongoDB not initialized")
         
+        if exclude_id:
+            query['id'] = {'$ne': exclude_id}
+        doc = self.collection.find_one(query, {'id': 1}, sort=[('id', 1)])
+        return doc['id'] if doc else None
+    
+    def _build_advanced_search_query(self, filters: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the MongoDB query document for an advanced search."""
         or_conditions = []
         
         if filters.get('name'):
@@ -230,19 +336,33 @@ class MongoDBAdapter(DatabaseAdapter):
         if filters.get('email'):
             or_conditions.append({'email': {'$regex': filters['email'], '$options': 'i'}})
         
+        query = {'$or': or_conditions} if or_conditions else {}  # Return all if no filters
+        
+        id_range = {}
         if filters.get('min_id'):
-            or_conditions.append({'id': {'$gte': filters['min_id']}})
+            id_range['$gte'] = filters['min_id']
         
         if filters.get('max_id'):
-            or_conditions.append({'id': {'$lte': filters['max_id']}})
+            id_range['$lte'] = filters['max_id']
         
-        if or_conditions:
-            query = {'$or': or_conditions}
-        else:
-            query = {}  # Return all if no filters
+        if id_range:
+            query['id'] = id_range
         
-        docs = self.collection.find(query).sort('id', 1)
-        return [self._doc_to_tuple(doc) for doc in docs]
+        return query
+    
+    def advanced_search(self, filters: Dict[str, Any]) -> List[Tuple]:
+        """Advanced search with multiple filters (text fields OR'd, ID range AND'd)."""
+        return list(self.iter_advanced_search(filters))
+    
+    def iter_advanced_search(self, filters: Dict[str, Any]) -> Iterator[Tuple]:
+        """Advanced search yielding rows as the cursor fetches batches."""
+        if self.collection is None:
+            raise ConnectionError("MongoDB not initialized")
+        
+        query = self._build_advanced_search_query(filters)
+        column_names = [c[0] for c in self.get_table_info()]
+        for doc in self.collection.find(query).sort('id', 1):
+            yield self._doc_to_tuple(doc, column_names)
     
     def export_to_csv(self, filename: str) -> str:
         """Export contacts to CSV file."""
@@ -303,7 +423,7 @@ class MongoDBAdapter(DatabaseAdapter):
         
         result = self.collection.update_many(
             {'id': {'$in': contact_ids}},
-            {'$set': {field: new_value, 'updated_at': datetime.datetime.utcnow()}}
+            {'$set': {field: normalize_field_value(field, new_value), 'updated_at': datetime.datetime.utcnow()}}
         )
         return result.modified_count
     
@@ -548,10 +668,9 @@ class MongoDBAdapter(DatabaseAdapter):
             # Recreate the collection (MongoDB creates it automatically on first insert)
             self.collection = self.db['contacts']
             
-            # Reset the counter to 0 (next ID will be 1)
-            counters = self.db['counters']
-            counters.delete_one({'_id': 'contact_id'})  # Delete old counter
-            counters.insert_one({'_id': 'contact_id', 'sequence_value': 0})
+            # Reset the counter (next ID will be 1) and recreate the dropped indexes
+            self.db['counters'].delete_one({'_id': 'contact_id'})  # Delete old counter
+            self.create_table()
             
             return True
         except Exception as e:
@@ -7,18 +7,22 @@ import csv
 import json
 import datetime
 import os
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from sqlalchemy import create_engine, text, MetaData, Table, Column, Integer, String, Text, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
 
 from ..base import DatabaseAdapter
 from ...core.schema_manager import schema_manager
+from ...utils.normalization import (NORMALIZED_FIELDS, collect_unstripped_values, normalize_contact_fields,
+                                   normalize_field_value)
 
 
 class MySQLAdapter(DatabaseAdapter):
     """MySQL implementation of the DatabaseAdapter interface."""
     
+    error_types = (SQLAlchemyError, pymysql.MySQLError, ConnectionError)
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize MySQL adapter with configuration."""
         super().__init__(config)
@@ -109,6 +113,53 @@ class MySQLAdapter(DatabaseAdapter):
             conn.execute(text(create_table_sql))
             conn.commit()
     
+    def ensure_indexes(self) -> None:
+        """Create indexes on name, email and phone if they don't exist.
+        
+        MySQL has no CREATE INDEX IF NOT EXISTS, so existing indexes are looked
+        up first. The default utf8mb4 collation is case-insensitive, so a plain
+        prefix index on email serves case-insensitive lookups.
+        """
+        if self.engine is None:
+            raise ConnectionError("MySQL engine not initialized")
+        
+        indexes = {
+            'idx_contacts_name': 'name',
+            'idx_contacts_email': 'email(64)',
+            'idx_contacts_phone': 'phone',
+        }
+        with self.engine.connect() as conn:
+            result = conn.execute(text(
+                "SELECT DISTINCT index_name FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = 'contacts'"
+            ))
+            existing = {row[0] for row in result}
+            for index_name, column in indexes.items():
+                if index_name not in existing:
+                    conn.execute(text(f"CREATE INDEX {index_name} ON contacts ({column})"))
+            conn.commit()
+    
+    def normalize_stored_values(self) -> int:
+        """Strip whitespace from stored emails/phones written before write-time normalization.
+        
+        Values are stripped in Python: SQL TRIM() only removes spaces, not the
+        tabs and newlines str.strip() removes at write time.
+        """
+        if self.engine is None:
+            raise ConnectionError("MySQL engine not initialized")
+        
+        updated_count = 0
+        with self.engine.connect() as conn:
+            result = conn.execute(text(f"SELECT id, {', '.join(NORMALIZED_FIELDS)} FROM contacts"))
+            updates = collect_unstripped_values(result.fetchall())
+            for field, params in updates.items():
+                if params:
+                    conn.execute(text(f"UPDATE contacts SET {field} = :value WHERE id = :id"),
+                                 [{'value': value, 'id': contact_id} for value, contact_id in params])
+                    updated_count += len(params)
+            conn.commit()
+        return updated_count
+    
     def add_contact(self, **fields) -> None:
         """Add a new contact to the database (dynamic fields)."""
         if 'name' not in fields:
@@ -123,7 +174,7 @@ class MySQLAdapter(DatabaseAdapter):
             columns = [row[0] for row in result if row[0] != 'id']
         
         # Filter fields to only include valid columns
-        insert_fields = {k: v for k, v in fields.items() if k in columns}
+        insert_fields = {k: v for k, v in normalize_contact_fields(fields).items() if k in columns}
         
         # Don't manually set timestamps - MySQL handles them automatically with DEFAULT CURRENT_TIMESTAMP
         # Remove timestamp fields if they were passed in (let MySQL handle them)
@@ -142,6 +193,35 @@ class MySQLAdapter(DatabaseAdapter):
             conn.execute(text(query), insert_fields)
             conn.commit()
     
+    def add_contacts_bulk(self, records: List[Dict[str, Any]]) -> int:
+        """Add many contacts in one transaction. Returns number of inserted contacts."""
+        if not records:
+            return 0
+        if any('name' not in record for record in records):
+            raise ValueError("Name is required")
+        
+        if self.engine is None:
+            raise ConnectionError("MySQL engine not initialized")
+        
+        # Get current table columns (timestamps are filled in by MySQL)
+        with self.engine.connect() as conn:
+            result = conn.execute(text("SHOW COLUMNS FROM contacts"))
+            columns = [row[0] for row in result if row[0] not in ('id', 'created_at', 'updated_at')]
+        
+        # Records with the same columns share one executemany
+        batches: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for record in records:
+            insert_fields = {k: v for k, v in normalize_contact_fields(record).items() if k in columns}
+            batches.setdefault(tuple(insert_fields), []).append(insert_fields)
+        
+        with self.engine.connect() as conn:
+            for column_names, rows in batches.items():
+                placeholders = ', '.join([f':{key}' for key in column_names])
+                query = f"INSERT INTO contacts ({', '.join(column_names)}) VALUES ({placeholders})"
+                conn.execute(text(query), rows)
+            conn.commit()
+        return len(records)
+    
     def view_contacts(self) -> List[Tuple]:
         """Retrieve all contacts from the database."""
         if self.engine is None:
@@ -179,7 +259,7 @@ class MySQLAdapter(DatabaseAdapter):
             valid_columns = [row[0] for row in result if row[0] != 'id']
         
         # Filter fields to only include valid columns
-        update_fields = {k: v for k, v in fields.items() if k in valid_columns}
+        update_fields = {k: v for k, v in normalize_contact_fields(fields).items() if k in valid_columns}
         
         # Don't manually set timestamps - MySQL handles updated_at automatically with ON UPDATE CURRENT_TIMESTAMP
         # Remove timestamp fields if they were passed in (let MySQL handle them)
@@ -217,7 +297,7 @@ class MySQLAdapter(DatabaseAdapter):
         
         with self.engine.connect() as conn:
             conn.execute(text(update_sql), {
-                'email': new_email,
+                'email': normalize_field_value('email', new_email),
                 'contact_id': contact_id
             })
             conn.commit()
@@ -252,11 +332,41 @@ class MySQLAdapter(DatabaseAdapter):
             result = conn.execute(text(search_sql), {'search_term': search_pattern})
             return [tuple(row) for row in result.fetchall()]
     
-    def advanced_search(self, filters: Dict[str, Any]) -> List[Tuple]:
-        """Advanced search with multiple filters."""
+    def find_contact_by_email(self, email: str, exclude_id: Optional[int] = None) -> Optional[int]:
+        """Return the ID of the first contact using this email (case-insensitive), or None.
+        
+        The bare-column equality can use idx_contacts_email, but the default
+        utf8mb4_0900_ai_ci collation is also accent-insensitive ('jose' = 'josé').
+        A binary comparison of the lower-cased value filters those candidates
+        down to case-only matches, as on the other databases.
+        """
+        email = email.strip()
+        return self._find_contact_id("email = :value AND LOWER(email) COLLATE utf8mb4_bin = :lowered",
+                                     email, exclude_id, {'lowered': email.lower()})
+    
+    def find_contact_by_phone(self, phone: str, exclude_id: Optional[int] = None) -> Optional[int]:
+        """Return the ID of the first contact using this phone number, or None."""
+        return self._find_contact_id("phone = :value", phone.strip(), exclude_id)
+    
+    def _find_contact_id(self, condition: str, value: str, exclude_id: Optional[int],
+                         extra_params: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """Return the lowest contact ID matching a condition on :value (plus any extra_params)."""
         if self.engine is None:
             raise ConnectionError("MySQL engine not initialized")
         
+        query = f"SELECT id FROM contacts WHERE {condition}"
+        params = {'value': value, **(extra_params or {})}
+        if exclude_id:
+            query += " AND id <> :exclude_id"
+            params['exclude_id'] = exclude_id
+        query += " ORDER BY id LIMIT 1"
+        
+        with self.engine.connect() as conn:
+            row = conn.execute(text(query), params).fetchone()
+            return row[0] if row else None
+    
+    def _build_advanced_search_query(self, filters: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+        """Build the SQL query and bind parameters for an advanced search."""
         where_conditions = []
         params = {}
         
@@ -272,23 +382,50 @@ class MySQLAdapter(DatabaseAdapter):
             where_conditions.append("email LIKE :email")
             params['email'] = f"%{filters['email']}%"
         
-        if filters.get('min_id'):
-            where_conditions.append("id >= :min_id")
-            params['min_id'] = filters['min_id']
+        # Text filters match any field; the ID range narrows the result so the
+        # primary key index can drive the scan.
+        if where_conditions:
+            where_conditions = ["(" + " OR ".join(where_conditions) + ")"]
         
-        if filters.get('max_id'):
+        min_id, max_id = filters.get('min_id'), filters.get('max_id')
+        if min_id and max_id:
+            where_conditions.append("id BETWEEN :min_id AND :max_id")
+            params['min_id'], params['max_id'] = min_id, max_id
+        elif min_id:
+            where_conditions.append("id >= :min_id")
+            params['min_id'] = min_id
+        elif max_id:
             where_conditions.append("id <= :max_id")
-            params['max_id'] = filters['max_id']
+            params['max_id'] = max_id
         
         query = "SELECT * FROM contacts"
         if where_conditions:
-            query += " WHERE " + " OR ".join(where_conditions)
+            query += " WHERE " + " AND ".join(where_conditions)
         query += " ORDER BY id"
         
+        return query, params
+    
+    def advanced_search(self, filters: Dict[str, Any]) -> List[Tuple]:
+        """Advanced search with multiple filters."""
+        if self.engine is None:
+            raise ConnectionError("MySQL engine not initialized")
+        
+        query, params = self._build_advanced_search_query(filters)
         with self.engine.connect() as conn:
             result = conn.execute(text(query), params)
             return [tuple(row) for row in result.fetchall()]
     
+    def iter_advanced_search(self, filters: Dict[str, Any]) -> Iterator[Tuple]:
+        """Advanced search yielding rows from an unbuffered server-side cursor."""
+        if self.engine is None:
+            raise ConnectionError("MySQL engine not initialized")
+        
+        query, params = self._build_advanced_search_query(filters)
+        with self.engine.connect() as conn:
+            result = conn.execution_options(stream_results=True).execute(text(query), params)
+            for row in result:
+                yield tuple(row)
+    
     def export_to_csv(self, filename: str) -> str:
         """Export contacts to CSV file."""
         contacts = self.view_contacts()
@@ -359,7 +496,7 @@ class MySQLAdapter(DatabaseAdapter):
         placeholders = ','.join([':id' + str(i) for i in range(len(contact_ids))])
         update_sql = f"UPDATE contacts SET {field} = :new_value WHERE id IN ({placeholders})"
         
-        params = {'new_value': new_value}
+        params = {'new_value': normalize_field_value(field, new_value)}
         for i, contact_id in enumerate(contact_ids):
             params[f'id{i}'] = contact_id
         
@@ -610,6 +747,9 @@ class MySQLAdapter(DatabaseAdapter):
                 
                 conn.commit()
             
+            # Dropping the table dropped its indexes too
+            self.ensure_indexes()
+            
             return True
         except Exception as e:
             print(f"Reset table error: {e}")
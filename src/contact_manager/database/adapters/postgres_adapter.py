@@ -3,20 +3,27 @@ PostgreSQL database adapter using psycopg2.
 """
 
 import psycopg2
-from psycopg2.extras import RealDictCursor
+from psycopg2.extras import RealDictCursor, execute_values
 import csv
 import json
 import datetime
 import os
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 from ..base import DatabaseAdapter
 from ...core.schema_manager import schema_manager
+from ...utils.normalization import (NORMALIZED_FIELDS, collect_unstripped_values, normalize_contact_fields,
+                                   normalize_field_value)
+
+# Rows fetched per round trip when streaming search results
+SEARCH_FETCH_SIZE = 500
 
 
 class PostgreSQLAdapter(DatabaseAdapter):
     """PostgreSQL implementation of the DatabaseAdapter interface."""
     
+    error_types = (psycopg2.Error, ConnectionError)
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize PostgreSQL adapter with configuration."""
         super().__init__(config)
@@ -97,6 +104,37 @@ class PostgreSQLAdapter(DatabaseAdapter):
         cursor.close()
         conn.close()
     
+    def ensure_indexes(self) -> None:
+        """Create indexes on name, lower-cased email and phone if they don't exist."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts (name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contacts_email_lower ON contacts (LOWER(email))")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contacts_phone ON contacts (phone)")
+        conn.commit()
+        cursor.close()
+        conn.close()
+    
+    def normalize_stored_values(self) -> int:
+        """Strip whitespace from stored emails/phones written before write-time normalization.
+        
+        Values are stripped in Python: SQL TRIM() only removes spaces, not the
+        tabs and newlines str.strip() removes at write time.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT id, {', '.join(NORMALIZED_FIELDS)} FROM contacts")
+        updates = collect_unstripped_values(cursor.fetchall())
+        updated_count = 0
+        for field, params in updates.items():
+            if params:
+                cursor.executemany(f"UPDATE contacts SET {field} = %s WHERE id = %s", params)
+                updated_count += len(params)
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return updated_count
+    
     def add_contact(self, **fields) -> None:
         """Add a new contact to the database (dynamic fields)."""
         if 'name' not in fields:
@@ -113,7 +151,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         valid_columns = [row[0] for row in cursor.fetchall()]
         
         # Filter fields to only include valid columns
-        insert_fields = {k: v for k, v in fields.items() if k in valid_columns}
+        insert_fields = {k: v for k, v in normalize_contact_fields(fields).items() if k in valid_columns}
         
         # Don't manually set timestamps - PostgreSQL handles them automatically with DEFAULT CURRENT_TIMESTAMP
         # Remove timestamp fields if they were passed in (let PostgreSQL handle them)
@@ -135,6 +173,36 @@ class PostgreSQLAdapter(DatabaseAdapter):
         cursor.close()
         conn.close()
     
+    def add_contacts_bulk(self, records: List[Dict[str, Any]]) -> int:
+        """Add many contacts in one transaction. Returns number of inserted contacts."""
+        if not records:
+            return 0
+        if any('name' not in record for record in records):
+            raise ValueError("Name is required")
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("""
+            SELECT column_name FROM information_schema.columns 
+            WHERE table_name = 'contacts' AND column_name NOT IN ('id', 'created_at', 'updated_at')
+        """)
+        valid_columns = [row[0] for row in cursor.fetchall()]
+        
+        # Records with the same columns share one multi-row INSERT
+        batches: Dict[Tuple[str, ...], List[Tuple]] = {}
+        for record in records:
+            insert_fields = {k: v for k, v in normalize_contact_fields(record).items() if k in valid_columns}
+            batches.setdefault(tuple(insert_fields), []).append(tuple(insert_fields.values()))
+        
+        try:
+            for columns, rows in batches.items():
+                execute_values(cursor, f"INSERT INTO contacts ({', '.join(columns)}) VALUES %s", rows)
+            conn.commit()
+        finally:
+            cursor.close()
+            conn.close()
+        return len(records)
+    
     def view_contacts(self) -> List[Tuple]:
         """Retrieve all contacts from the database."""
         conn = self.get_connection()
@@ -171,7 +239,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         valid_columns = [row[0] for row in cursor.fetchall()]
         
         # Filter fields to only include valid columns
-        update_fields = {k: v for k, v in fields.items() if k in valid_columns}
+        update_fields = {k: v for k, v in normalize_contact_fields(fields).items() if k in valid_columns}
         
         # Don't manually set timestamps - PostgreSQL handles updated_at automatically with trigger
         # Remove timestamp fields if they were passed in (let PostgreSQL handle them)
@@ -230,11 +298,33 @@ class PostgreSQLAdapter(DatabaseAdapter):
         conn.close()
         return rows
     
-    def advanced_search(self, filters: Dict[str, Any]) -> List[Tuple]:
-        """Advanced search with multiple filters."""
+    def find_contact_by_email(self, email: str, exclude_id: Optional[int] = None) -> Optional[int]:
+        """Return the ID of the first contact using this email (case-insensitive), or None."""
+        return self._find_contact_id("LOWER(email) = %s", email.strip().lower(), exclude_id)
+    
+    def find_contact_by_phone(self, phone: str, exclude_id: Optional[int] = None) -> Optional[int]:
+        """Return the ID of the first contact using this phone number, or None."""
+        return self._find_contact_id("phone = %s", phone.strip(), exclude_id)
+    
+    def _find_contact_id(self, condition: str, value: str, exclude_id: Optional[int]) -> Optional[int]:
+        """Return the lowest contact ID matching a single-value condition."""
+        query = f"SELECT id FROM contacts WHERE {condition}"
+        params = [value]
+        if exclude_id:
+            query += " AND id <> %s"
+            params.append(exclude_id)
+        query += " ORDER BY id LIMIT 1"
+        
         conn = self.get_connection()
         cursor = conn.cursor()
-        
+        cursor.execute(query, params)
+        row = cursor.fetchone()
+        cursor.close()
+        conn.close()
+        return row[0] if row else None
+    
+    def _build_advanced_search_query(self, filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """Build the SQL query and parameters for an advanced search."""
         where_conditions = []
         params = []
         
@@ -250,25 +340,54 @@ class PostgreSQLAdapter(DatabaseAdapter):
             where_conditions.append("email ILIKE %s")
             params.append(f"%{filters['email']}%")
         
-        if filters.get('min_id'):
-            where_conditions.append("id >= %s")
-            params.append(filters['min_id'])
+        # Text filters match any field; the ID range narrows the result so the
+        # primary key index can drive the scan.
+        if where_conditions:
+            where_conditions = ["(" + " OR ".join(where_conditions) + ")"]
         
-        if filters.get('max_id'):
+        min_id, max_id = filters.get('min_id'), filters.get('max_id')
+        if min_id and max_id:
+            where_conditions.append("id BETWEEN %s AND %s")
+            params.extend((min_id, max_id))
+        elif min_id:
+            where_conditions.append("id >= %s")
+            params.append(min_id)
+        elif max_id:
             where_conditions.append("id <= %s")
-            params.append(filters['max_id'])
+            params.append(max_id)
         
         query = "SELECT * FROM contacts"
         if where_conditions:
-            query += " WHERE " + " OR ".join(where_conditions)
+            query += " WHERE " + " AND ".join(where_conditions)
         query += " ORDER BY id"
         
+        return query, params
+    
+    def advanced_search(self, filters: Dict[str, Any]) -> List[Tuple]:
+        """Advanced search with multiple filters."""
+        query, params = self._build_advanced_search_query(filters)
+        conn = self.get_connection()
+        cursor = conn.cursor()
         cursor.execute(query, params)
         rows = cursor.fetchall()
         cursor.close()
         conn.close()
         return rows
     
+    def iter_advanced_search(self, filters: Dict[str, Any]) -> Iterator[Tuple]:
+        """Advanced search yielding rows from a server-side cursor."""
+        query, params = self._build_advanced_search_query(filters)
+        conn = self.get_connection()
+        try:
+            # A named cursor keeps the result set on the server and fetches it in batches
+            cursor = conn.cursor(name='advanced_search_cur')
+            cursor.itersize = SEARCH_FETCH_SIZE
+            cursor.execute(query, params)
+            yield from cursor
+            cursor.close()
+        finally:
+            conn.close()
+    
     def export_to_csv(self, filename: str) -> str:
         """Export contacts to CSV file."""
         contacts = self.view_contacts()
@@ -343,7 +462,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
         placeholders = ','.join(['%s' for _ in contact_ids])
         query = f"UPDATE contacts SET {field} = %s, updated_at = CURRENT_TIMESTAMP WHERE id IN ({placeholders})"
         
-        cursor.execute(query, [new_value] + contact_ids)
+        cursor.execute(query, [normalize_field_value(field, new_value)] + contact_ids)
         updated_count = cursor.rowcount
         conn.commit()
         cursor.close()
@@ -631,6 +750,9 @@ class PostgreSQLAdapter(DatabaseAdapter):
             cursor.close()
             conn.close()
             
+            # Dropping the table dropped its indexes too
+            self.ensure_indexes()
+            
             # Vacuum to reclaim space
             conn = self.get_connection()
             conn.autocommit = True
@@ -10,15 +10,24 @@ import re
 import shutil
 import datetime
 import os
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 
 from ..base import DatabaseAdapter
 from ...core.schema_manager import schema_manager
+from ...utils.normalization import (NORMALIZED_FIELDS, collect_unstripped_values, normalize_contact_fields,
+                                   normalize_field_value)
+
+
+def _py_lower(value):
+    """Unicode-aware lower() for SQL expressions (SQLite's LOWER() is ASCII-only)."""
+    return value.lower() if isinstance(value, str) else value
 
 
 class SQLiteAdapter(DatabaseAdapter):
     """SQLite implementation of the DatabaseAdapter interface."""
     
+    error_types = (sqlite3.Error, ConnectionError)
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize SQLite adapter with configuration."""
         super().__init__(config)
@@ -55,6 +64,35 @@ class SQLiteAdapter(DatabaseAdapter):
         conn.commit()
         conn.close()
     
+    def ensure_indexes(self) -> None:
+        """Create indexes on name, lower-cased email and phone if they don't exist."""
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contacts_name ON contacts (name)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contacts_email_lower ON contacts (LOWER(email))")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_contacts_phone ON contacts (phone)")
+        conn.commit()
+        conn.close()
+    
+    def normalize_stored_values(self) -> int:
+        """Strip whitespace from stored emails/phones written before write-time normalization.
+        
+        Values are stripped in Python: SQL TRIM() only removes spaces, not the
+        tabs and newlines str.strip() removes at write time.
+        """
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute(f"SELECT id, {', '.join(NORMALIZED_FIELDS)} FROM contacts")
+        updates = collect_unstripped_values(cursor.fetchall())
+        updated_count = 0
+        for field, params in updates.items():
+            if params:
+                cursor.executemany(f"UPDATE contacts SET {field} = ? WHERE id = ?", params)
+                updated_count += len(params)
+        conn.commit()
+        conn.close()
+        return updated_count
+    
     def add_contact(self, **fields) -> None:
         """Add a new contact to the database (dynamic fields)."""
         if 'name' not in fields:
@@ -69,7 +107,7 @@ class SQLiteAdapter(DatabaseAdapter):
         valid_columns = [col[1] for col in table_info if col[1] != 'id']
         
         # Filter fields to only include valid columns
-        insert_fields = {k: v for k, v in fields.items() if k in valid_columns}
+        insert_fields = {k: v for k, v in normalize_contact_fields(fields).items() if k in valid_columns}
         
         # For SQLite, we need to manually set timestamps since it doesn't have automatic timestamp updates
         from datetime import datetime
@@ -94,6 +132,41 @@ class SQLiteAdapter(DatabaseAdapter):
         conn.commit()
         conn.close()
     
+    def add_contacts_bulk(self, records: List[Dict[str, Any]]) -> int:
+        """Add many contacts in one transaction. Returns number of inserted contacts."""
+        if not records:
+            return 0
+        if any('name' not in record for record in records):
+            raise ValueError("Name is required")
+        
+        conn = self.get_connection()
+        cursor = conn.cursor()
+        cursor.execute("PRAGMA table_info(contacts)")
+        valid_columns = [col[1] for col in cursor.fetchall() if col[1] != 'id']
+        
+        from datetime import datetime
+        current_time = datetime.utcnow().isoformat()
+        
+        # Records with the same columns share one INSERT statement
+        batches: Dict[Tuple[str, ...], List[Tuple]] = {}
+        for record in records:
+            insert_fields = {k: v for k, v in normalize_contact_fields(record).items() if k in valid_columns}
+            if 'created_at' in valid_columns:
+                insert_fields['created_at'] = current_time
+            if 'updated_at' in valid_columns:
+                insert_fields['updated_at'] = current_time
+            batches.setdefault(tuple(insert_fields), []).append(tuple(insert_fields.values()))
+        
+        try:
+            for columns, rows in batches.items():
+                placeholders = ', '.join(['?' for _ in columns])
+                query = f"INSERT INTO contacts ({', '.join(columns)}) VALUES ({placeholders})"
+                cursor.executemany(query, rows)
+            conn.commit()
+        finally:
+            conn.close()
+        return len(records)
+    
     def view_contacts(self) -> List[Tuple]:
         """Retrieve all contacts from the database."""
         conn = self.get_connection()
@@ -126,7 +199,7 @@ class SQLiteAdapter(DatabaseAdapter):
         valid_columns = [col[1] for col in table_info if col[1] != 'id']
         
         # Filter fields to only include valid columns
-        update_fields = {k: v for k, v in fields.items() if k in valid_columns}
+        update_fields = {k: v for k, v in normalize_contact_fields(fields).items() if k in valid_columns}
         
         # For SQLite, manually update the updated_at timestamp
         from datetime import datetime
@@ -182,11 +255,41 @@ class SQLiteAdapter(DatabaseAdapter):
         conn.close()
         return rows
     
-    def advanced_search(self, filters: Dict[str, Any]) -> List[Tuple]:
-        """Advanced search with multiple filters."""
+    def find_contact_by_email(self, email: str, exclude_id: Optional[int] = None) -> Optional[int]:
+        """Return the ID of the first contact using this email (case-insensitive), or None.
+        
+        SQLite's LOWER() only folds ASCII letters, so ASCII emails use the
+        idx_contacts_email_lower index while others are compared with
+        Python's str.lower() registered on the connection.
+        """
+        email = email.strip().lower()
+        if email.isascii():
+            return self._find_contact_id("LOWER(email) = ?", email, exclude_id)
+        return self._find_contact_id("py_lower(email) = ?", email, exclude_id)
+    
+    def find_contact_by_phone(self, phone: str, exclude_id: Optional[int] = None) -> Optional[int]:
+        """Return the ID of the first contact using this phone number, or None."""
+        return self._find_contact_id("phone = ?", phone.strip(), exclude_id)
+    
+    def _find_contact_id(self, condition: str, value: str, exclude_id: Optional[int]) -> Optional[int]:
+        """Return the lowest contact ID matching a single-value condition."""
+        query = f"SELECT id FROM contacts WHERE {condition}"
+        params = [value]
+        if exclude_id:
+            query += " AND id <> ?"
+            params.append(exclude_id)
+        query += " ORDER BY id LIMIT 1"
+        
         conn = self.get_connection()
+        conn.create_function('py_lower', 1, _py_lower, deterministic=True)
         cursor = conn.cursor()
-        
+        cursor.execute(query, params)
+        row = cursor.fetchone()
+        conn.close()
+        return row[0] if row else None
+    
+    def _build_advanced_search_query(self, filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """Build the SQL query and parameters for an advanced search."""
         where_conditions = []
         params = []
         
@@ -202,23 +305,48 @@ class SQLiteAdapter(DatabaseAdapter):
             where_conditions.append("email LIKE ?")
             params.append(f"%{filters['email']}%")
         
-        if filters.get('min_id'):
-            where_conditions.append("id >= ?")
-            params.append(filters['min_id'])
+        # Text filters match any field; the ID range narrows the result so the
+        # primary key index can drive the scan.
+        if where_conditions:
+            where_conditions = ["(" + " OR ".join(where_conditions) + ")"]
         
-        if filters.get('max_id'):
+        min_id, max_id = filters.get('min_id'), filters.get('max_id')
+        if min_id and max_id:
+            where_conditions.append("id BETWEEN ? AND ?")
+            params.extend((min_id, max_id))
+        elif min_id:
+            where_conditions.append("id >= ?")
+            params.append(min_id)
+        elif max_id:
             where_conditions.append("id <= ?")
-            params.append(filters['max_id'])
+            params.append(max_id)
         
         query = "SELECT * FROM contacts"
         if where_conditions:
-            query += " WHERE " + " OR ".join(where_conditions)
+            query += " WHERE " + " AND ".join(where_conditions)
         
+        return query, params
+    
+    def advanced_search(self, filters: Dict[str, Any]) -> List[Tuple]:
+        """Advanced search with multiple filters."""
+        query, params = self._build_advanced_search_query(filters)
+        conn = self.get_connection()
+        cursor = conn.cursor()
         cursor.execute(query, params)
         rows = cursor.fetchall()
         conn.close()
         return rows
     
+    def iter_advanced_search(self, filters: Dict[str, Any]) -> Iterator[Tuple]:
+        """Advanced search yielding rows as the cursor produces them."""
+        query, params = self._build_advanced_search_query(filters)
+        conn = self.get_connection()
+        try:
+            # sqlite3 cursors step through the result set lazily
+            yield from conn.execute(query, params)
+        finally:
+            conn.close()
+    
     def export_to_csv(self, filename: str) -> str:
         """Export contacts to CSV file."""
         contacts = self.view_contacts()
@@ -292,7 +420,7 @@ class SQLiteAdapter(DatabaseAdapter):
         placeholders = ','.join(['?' for _ in contact_ids])
         query = f"UPDATE contacts SET {field} = ? WHERE id IN ({placeholders})"
         
-        cursor.execute(query, [new_value] + contact_ids)
+        cursor.execute(query, [normalize_field_value(field, new_value)] + contact_ids)
         updated_count = cursor.rowcount
         conn.commit()
         conn.close()
@@ -560,6 +688,9 @@ class SQLiteAdapter(DatabaseAdapter):
             conn.commit()
             conn.close()
             
+            # Dropping the table dropped its indexes too
+            self.ensure_indexes()
+            
             # VACUUM to reclaim space
             conn = sqlite3.connect(self.db_path)
             conn.execute("VACUUM")
@@ -4,12 +4,15 @@ Defines the interface that all database implementations must follow.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Type
 
 
 class DatabaseAdapter(ABC):
     """Abstract base class for database operations."""
     
+    # Exception types this adapter raises for database failures (extended per driver)
+    error_types: Tuple[Type[BaseException], ...] = (ConnectionError,)
+    
     def __init__(self, config: Dict[str, Any]):
         """Initialize the database adapter with configuration."""
         self.config = config
@@ -31,12 +34,26 @@ class DatabaseAdapter(ABC):
         """Create the contacts table if it doesn't exist."""
         pass
     
+    def ensure_indexes(self) -> None:
+        """Create indexes for commonly searched columns if missing (optional, adapter-specific)."""
+        pass
+    
+    def normalize_stored_values(self) -> int:
+        """Strip whitespace from stored emails/phones (optional, adapter-specific). Returns rows changed."""
+        return 0
+    
     # Basic CRUD Operations
     @abstractmethod
     def add_contact(self, **fields) -> None:
         """Add a new contact to the database with dynamic fields."""
         pass
     
+    def add_contacts_bulk(self, records: List[Dict[str, Any]]) -> int:
+        """Add many contacts in one batch (optional, adapter-specific). Returns number inserted."""
+        for record in records:
+            self.add_contact(**record)
+        return len(records)
+    
     def update_contact(self, contact_id: int, **fields) -> None:
         """Update contact fields dynamically (optional, adapter-specific)."""
         raise NotImplementedError("Update contact not implemented for this adapter")
@@ -82,6 +99,10 @@ class DatabaseAdapter(ABC):
         """Advanced search with multiple filters."""
         pass
     
+    def iter_advanced_search(self, filters: Dict[str, Any]) -> Iterator[Tuple]:
+        """Advanced search yielding rows one at a time (streams where the adapter supports it)."""
+        return iter(self.advanced_search(filters))
+    
     # Data Import/Export Operations
     @abstractmethod
     def export_to_csv(self, filename: str) -> str:
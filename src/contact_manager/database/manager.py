@@ -2,7 +2,8 @@
 Database manager for handling database switching and global state.
 """
 
-from typing import Optional, Dict, Any
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from .base import DatabaseAdapter
 from .factory import DatabaseFactory
 from ..config.settings import settings
@@ -19,6 +20,10 @@ class DatabaseManager:
     _current_adapter: Optional[DatabaseAdapter] = None
     _current_db_type: str = "sqlite"
     
+    # Seconds a contacts snapshot may be reused even without a recorded mutation,
+    # bounding staleness when something writes through the adapter directly
+    SNAPSHOT_TTL = 5.0
+    
     def __new__(cls):
         """Ensure singleton pattern."""
         if cls._instance is None:
@@ -31,6 +36,8 @@ class DatabaseManager:
             self._initialized = True
             self._current_db_type = settings.get_default_database_type()
             self._current_adapter = None
+            self._mutation_seq = 0
+            self._snapshot = None  # (adapter, mutation_seq, taken_at, rows)
     
     @property
     def current_adapter(self) -> DatabaseAdapter:
@@ -39,6 +46,12 @@ class DatabaseManager:
             self._current_adapter = DatabaseFactory.create_adapter(self._current_db_type)
         return self._current_adapter
     
+    @property
+    def db_errors(self) -> Tuple[type, ...]:
+        """Exception types the current adapter raises for database failures (for except clauses)."""
+        adapter = self._current_adapter
+        return adapter.error_types if adapter is not None else DatabaseAdapter.error_types
+    
     @property
     def current_db_type(self) -> str:
         """Get the current database type."""
@@ -63,6 +76,13 @@ class DatabaseManager:
             old_adapter = self._current_adapter
             self._current_adapter = new_adapter
             self._current_db_type = db_type
+            self._snapshot = None
+            
+            # A database first opened at runtime needs the lookup indexes too
+            try:
+                new_adapter.ensure_indexes()
+            except Exception:
+                pass  # Best effort: the table may not exist yet
             
             # Update global settings
             settings.set_default_database_type(db_type)
@@ -85,6 +105,60 @@ class DatabaseManager:
             print(f"Failed to switch to {db_type}: {e}")
             return False
     
+    def mark_modified(self) -> None:
+        """Record that contacts changed so the next snapshot is read fresh."""
+        self._mutation_seq += 1
+    
+    @property
+    def data_version(self) -> Tuple[DatabaseAdapter, int]:
+        """Token that changes whenever contacts are modified or the database is switched."""
+        return (self.current_adapter, self._mutation_seq)
+    
+    def add_contact(self, **fields) -> None:
+        """Add a contact through the current adapter and record the change."""
+        try:
+            return self.current_adapter.add_contact(**fields)
+        finally:
+            self.mark_modified()
+    
+    def add_contacts_bulk(self, records: List[Dict[str, Any]]) -> int:
+        """Add many contacts through the current adapter in one batch and record the change."""
+        try:
+            return self.current_adapter.add_contacts_bulk(records)
+        finally:
+            self.mark_modified()
+    
+    def update_contact(self, contact_id: int, **fields) -> None:
+        """Update a contact through the current adapter and record the change."""
+        try:
+            return self.current_adapter.update_contact(contact_id, **fields)
+        finally:
+            self.mark_modified()
+    
+    def delete_contact(self, contact_id: int) -> None:
+        """Delete a contact through the current adapter and record the change."""
+        try:
+            return self.current_adapter.delete_contact(contact_id)
+        finally:
+            self.mark_modified()
+    
+    def get_contacts_snapshot(self) -> Tuple[Tuple, ...]:
+        """
+        Get all contacts, reusing the previous read while nothing has changed.
+        
+        The snapshot is refreshed after any recorded mutation, a database
+        switch, or SNAPSHOT_TTL seconds. It is returned as a tuple so callers
+        cannot modify the shared copy.
+        """
+        adapter = self.current_adapter
+        now = time.monotonic()
+        snapshot = self._snapshot
+        if (snapshot is None or snapshot[0] is not adapter or snapshot[1] != self._mutation_seq
+                or now - snapshot[2] > self.SNAPSHOT_TTL):
+            snapshot = (adapter, self._mutation_seq, now, tuple(adapter.view_contacts()))
+            self._snapshot = snapshot
+        return snapshot[3]
+    
     def get_connection_info(self) -> Dict[str, Any]:
         """Get information about the current database connection."""
         if self._current_adapter:
@@ -117,6 +191,7 @@ class DatabaseManager:
         """Force reconnection to the current database."""
         current_type = self._current_db_type
         self._current_adapter = None
+        self._snapshot = None
         try:
             # This will create a new adapter
             self.current_adapter.test_connection()
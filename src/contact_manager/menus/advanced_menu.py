@@ -3,11 +3,17 @@ Advanced Features Menu Handler
 Handles advanced features like analytics, export, import, etc.
 """
 
+from ..database.manager import db_manager
 from ..ui.ui import display_success, display_error, display_warning
 from ..ui.input_helpers import get_user_input, get_yes_no_input
 from ..ui.dynamic_ui import display_contacts_dynamic
-from ..core.core_operations import view_contacts, bulk_update, bulk_delete
+from ..core.core_operations import view_contacts, bulk_update, bulk_delete, get_contact_analytics
 from ..core.schema_manager import schema_manager
+from ..utils.prefetch import Prefetcher
+
+# Loads analytics in the background while the user is choosing a menu option
+_analytics_prefetch = Prefetcher(get_contact_analytics, 'analytics-prefetch',
+                                 version=lambda: db_manager.data_version)
 
 
 class AdvancedMenuHandler:
@@ -17,6 +23,7 @@ class AdvancedMenuHandler:
         """Show the advanced features menu."""
         while True:
             try:
+                _analytics_prefetch.start()
                 print("\n📊 Advanced Features")
                 print("="*50)
                 print("1. 📈 Contact Analytics")
@@ -70,7 +77,7 @@ class AdvancedMenuHandler:
         """Show contact analytics."""
         try:
             from ..ui.ui import display_contact_analytics
-            display_contact_analytics()
+            display_contact_analytics(_analytics_prefetch.result())
             input("\nPress Enter to continue...")
         except Exception as e:
             display_error(f"Analytics error: {str(e)}")
@@ -488,11 +495,12 @@ class AdvancedMenuHandler:
                     return
             
             if field_name == 'phone' and new_value:
-                from ..core.core_operations import validate_phone, format_phone
-                if not validate_phone(new_value):
+                from ..core.core_operations import validate_and_format_phone
+                formatted_phone = validate_and_format_phone(new_value)
+                if formatted_phone is None:
                     display_error("Invalid phone format!")
                     return
-                new_value = format_phone(new_value)
+                new_value = formatted_phone
             
             # Confirm the operation
             print(f"\n⚠️  Confirmation:")
@@ -643,11 +651,12 @@ class AdvancedMenuHandler:
         search_term = search_term.lower()
         matching_contacts = []
         
+        columns = schema_manager.get_table_columns()
         for contact in contacts:
-            contact_dict = schema_manager.get_contact_as_dict(contact)
-            name = str(contact_dict.get('name', '')).lower()
-            email = str(contact_dict.get('email', '')).lower()
-            phone = str(contact_dict.get('phone', '')).lower()
+            record = schema_manager.get_contact(contact, columns)
+            name = str(getattr(record, 'name', '')).lower()
+            email = str(getattr(record, 'email', '')).lower()
+            phone = str(getattr(record, 'phone', '')).lower()
             
             if (search_term in name or search_term in email or search_term in phone):
                 matching_contacts.append(contact[0])
@@ -674,9 +683,10 @@ class AdvancedMenuHandler:
         
         matching_contacts = []
         
+        columns = schema_manager.get_table_columns()
         for contact in contacts:
-            contact_dict = schema_manager.get_contact_as_dict(contact)
-            email = str(contact_dict.get('email', '')).lower()
+            record = schema_manager.get_contact(contact, columns)
+            email = str(getattr(record, 'email', '')).lower()
             
             if email.endswith(domain):
                 matching_contacts.append(contact[0])
@@ -700,9 +710,10 @@ class AdvancedMenuHandler:
         pattern = pattern.lower().strip()
         matching_contacts = []
         
+        columns = schema_manager.get_table_columns()
         for contact in contacts:
-            contact_dict = schema_manager.get_contact_as_dict(contact)
-            phone = str(contact_dict.get('phone', '')).lower()
+            record = schema_manager.get_contact(contact, columns)
+            phone = str(getattr(record, 'phone', '')).lower()
             
             if pattern in phone:
                 matching_contacts.append(contact[0])
@@ -106,7 +106,6 @@ class ContactMenuHandler:
                 return
             
             # Display current contact information
-            from ..core.schema_manager import schema_manager
             current_data = schema_manager.get_contact_as_dict(current_contact)
             
             print(f"\n📋 Current Contact Information (ID: {contact_id}):")
@@ -6,7 +6,13 @@ Handles database management and switching operations.
 import os
 from ..database.manager import db_manager
 from ..ui.ui import display_success, display_error, display_warning
-from ..core.core_operations import view_contacts
+from ..core.core_operations import view_contacts, get_database_stats
+from ..core.schema_manager import schema_manager
+from ..utils.prefetch import Prefetcher
+
+# Loads statistics in the background while the user is choosing a menu option
+_stats_prefetch = Prefetcher(get_database_stats, 'stats-prefetch',
+                             version=lambda: db_manager.data_version)
 
 
 class DatabaseMenuHandler:
@@ -16,6 +22,7 @@ class DatabaseMenuHandler:
         """Show the database management menu."""
         while True:
             try:
+                _stats_prefetch.start()
                 print("\n⚙️  Database Management")
                 print("="*50)
                 print("1. 📊 Database Statistics")
@@ -63,7 +70,7 @@ class DatabaseMenuHandler:
         """Show database statistics."""
         try:
             from ..ui.ui import display_database_stats
-            display_database_stats()
+            display_database_stats(_stats_prefetch.result())
             input("\nPress Enter to continue...")
         except Exception as e:
             display_error(f"Database stats error: {str(e)}")
@@ -172,7 +179,7 @@ class DatabaseMenuHandler:
                 success = db_manager.switch_database(db_type)
                 if success:
                     display_success(f"✅ Successfully switched to {db_type.upper()}!")
-                    
+
                     # Update health status after successful switch
                     try:
                         from ..core.state_tracker import set_db_health
@@ -215,9 +222,10 @@ class DatabaseMenuHandler:
             print("1. 🧽 Light Cleanup (Remove empty/invalid records)")
             print("2. 🗑️  Delete All Data (Keep table structure & columns)")
             print("3. 🔄 Reset Table Structure (Reset to 6 base columns)")
+            print("4. ✂️  Normalize Emails/Phones (Strip whitespace from legacy records)")
             print("="*50)
             
-            choice = input("\nEnter your choice (0-3): ").strip()
+            choice = input("\nEnter your choice (0-4): ").strip()
             
             if choice == '0':
                 return
@@ -227,8 +235,10 @@ class DatabaseMenuHandler:
                 self._delete_all_data_menu(contact_count)
             elif choice == '3':
                 self._reset_table_structure_menu(contact_count)
+            elif choice == '4':
+                self._normalize_values_menu(contact_count)
             else:
-                display_error("Invalid choice! Please enter 0-3.")
+                display_error("Invalid choice! Please enter 0-4.")
     
     def _light_cleanup_menu(self, contact_count: int) -> None:
         """Perform light cleanup - remove empty/invalid records."""
@@ -251,6 +261,7 @@ class DatabaseMenuHandler:
             if confirm in ['', 'y', 'yes']:
                 print("\n🧽 Performing light cleanup...")
                 cleaned_count = db_manager.current_adapter.cleanup_db()
+                db_manager.mark_modified()
                 
                 if cleaned_count > 0:
                     display_success(f"✅ Light cleanup completed! Removed {cleaned_count} invalid records.")
@@ -264,6 +275,42 @@ class DatabaseMenuHandler:
         
         input("\nPress Enter to continue...")
     
+    def _normalize_values_menu(self, contact_count: int) -> None:
+        """One-time migration: strip whitespace from emails/phones stored before write-time normalization."""
+        print("\n✂️  Normalize Emails/Phones")
+        print("-" * 40)
+        
+        try:
+            if contact_count == 0:
+                print("ℹ️  Database is empty, nothing to normalize!")
+                input("\nPress Enter to continue...")
+                return
+            
+            print("This will strip leading/trailing whitespace from stored:")
+            print("• Email addresses")
+            print("• Phone numbers")
+            print("\n💡 Only needed once for records saved by older versions; duplicate checks")
+            print("   match values exactly and can miss padded ones.")
+            
+            confirm = input("\nProceed with normalization? (Y/n): ").strip().lower()
+            
+            if confirm in ['', 'y', 'yes']:
+                print("\n✂️  Normalizing stored values...")
+                updated_count = db_manager.current_adapter.normalize_stored_values()
+                db_manager.mark_modified()
+                
+                if updated_count > 0:
+                    display_success(f"Normalization completed! Updated {updated_count} values.")
+                else:
+                    print("ℹ️  All emails and phones are already normalized!")
+            else:
+                print("ℹ️  Normalization cancelled.")
+                
+        except Exception as e:
+            display_error(f"Normalization error: {str(e)}")
+        
+        input("\nPress Enter to continue...")
+    
     def _delete_all_data_menu(self, contact_count: int) -> None:
         """Delete all data but keep table structure."""
         print("\n🗑️ Delete All Data")
@@ -293,6 +340,8 @@ class DatabaseMenuHandler:
             if confirm2 == 'DELETE ALL':
                 print("\n🗑️  Deleting all contacts...")
                 result = db_manager.current_adapter.full_cleanup_db()
+                db_manager.mark_modified()
+                schema_manager.invalidate_column_cache()
                 
                 if result:
                     display_success("✅ All data deleted successfully!")
@@ -319,7 +368,6 @@ class DatabaseMenuHandler:
             
             # Show current table structure
             try:
-                from ..core.schema_manager import schema_manager
                 columns = schema_manager.get_table_columns()
                 print(f"\n📋 Current table has {len(columns)} columns:")
                 for i, col in enumerate(columns, 1):
@@ -348,6 +396,8 @@ class DatabaseMenuHandler:
             if confirm2 == 'RESET TABLE':
                 print("\n🔄 Resetting table structure...")
                 result = db_manager.current_adapter.reset_table_structure()
+                db_manager.mark_modified()
+                schema_manager.invalidate_column_cache()
                 
                 if result:
                     display_success("✅ Table structure reset successfully!")
@@ -551,6 +601,8 @@ class DatabaseMenuHandler:
                 
                 try:
                     result = db_manager.current_adapter.restore_database(selected_file)
+                    db_manager.mark_modified()
+                    schema_manager.invalidate_column_cache()
                     
                     if result:
                         display_success("✅ Database restored successfully!")
@@ -599,7 +651,6 @@ class DatabaseMenuHandler:
             
             # Show current table structure
             try:
-                from ..core.schema_manager import schema_manager
                 columns = schema_manager.get_table_columns()
                 print(f"\n📋 Current table has {len(columns)} columns:")
                 for i, col in enumerate(columns, 1):
@@ -659,6 +710,8 @@ class DatabaseMenuHandler:
                     # First try the reset_table_structure method
                     if hasattr(db_manager.current_adapter, 'reset_table_structure'):
                         result = db_manager.current_adapter.reset_table_structure()
+                        db_manager.mark_modified()
+                        schema_manager.invalidate_column_cache()
                         
                         if result:
                             display_success("✅ Database reset completed successfully!")
@@ -671,6 +724,8 @@ class DatabaseMenuHandler:
                         # Fallback to full cleanup if reset_table_structure is not available
                         print("ℹ️  Using fallback cleanup method...")
                         result = db_manager.current_adapter.full_cleanup_db()
+                        db_manager.mark_modified()
+                        schema_manager.invalidate_column_cache()
                         
                         if result:
                             display_success("✅ Database cleanup completed!")
@@ -8,7 +8,7 @@ from core_operations import (add_contact, view_contacts, update_contact, update_
                             update_contact_email, delete_contact, search_contact, get_contact_by_id,
                             export_to_csv, export_to_json, import_from_csv, advanced_search,
                             bulk_update, bulk_delete, validate_email, 
-                            validate_phone, format_phone, check_data_integrity, get_contact_analytics,
+                            validate_and_format_phone, check_data_integrity, get_contact_analytics,
                             get_database_stats, get_table_info, add_column, 
                             backup_database, restore_database, full_cleanup_db)
 from ..core.schema_manager import schema_manager
@@ -51,13 +51,13 @@ def add_contact_menu():
             display_error("Invalid email format. Please correct and try again.")
             return
         
-        if phone_val and not validate_phone(phone_val):
-            display_error("Invalid phone number format. Please correct and try again.")
-            return
-        
         # Normalize phone format if provided
         if phone_val:
-            contact_data['phone'] = format_phone(phone_val)
+            formatted_phone = validate_and_format_phone(phone_val)
+            if formatted_phone is None:
+                display_error("Invalid phone number format. Please correct and try again.")
+                return
+            contact_data['phone'] = formatted_phone
         
         # Add contact
         add_contact(**contact_data)
@@ -171,10 +171,11 @@ def update_contact_menu():
                 return
         
         if field_to_update == 'phone' and new_value:
-            if not validate_phone(new_value):
+            formatted_phone = validate_and_format_phone(new_value)
+            if formatted_phone is None:
                 display_error("Invalid phone number. Enter 7-15 digits; separators are allowed.")
                 return
-            new_value = format_phone(new_value)
+            new_value = formatted_phone
         
         # Update the contact
         try:
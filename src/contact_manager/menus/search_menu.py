@@ -3,7 +3,8 @@ Search Menu Handler
 Handles search operations and advanced search functionality.
 """
 
-from ..core.core_operations import search_contact, advanced_search
+from itertools import chain
+from ..core.core_operations import search_contact, iter_advanced_search
 from ..ui.dynamic_ui import display_contacts_dynamic
 from ..ui.ui import display_success, display_error, display_warning
 from ..ui.input_helpers import get_user_input
@@ -87,11 +88,13 @@ class SearchMenuHandler:
                 display_warning("No search criteria provided.")
                 return
             
-            results = advanced_search(filters)
+            # Stream matches straight from the database cursor into the display
+            results = iter_advanced_search(filters)
+            first = next(results, None)
             
-            if results:
-                print(f"\n📋 Found {len(results)} contacts:")
-                display_contacts_dynamic(results, detailed=False)
+            if first is not None:
+                count = display_contacts_dynamic(chain((first,), results), detailed=False)
+                print(f"\n📋 Found {count} contacts.")
             else:
                 display_warning("No contacts found matching your criteria.")
                 
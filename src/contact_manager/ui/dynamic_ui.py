@@ -2,87 +2,210 @@
 Dynamic UI Module - Generates UI elements based on current database schema
 """
 
-from typing import List, Dict, Any
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, islice
+from operator import itemgetter
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
 from ..core.schema_manager import schema_manager
 from ..core.core_operations import validate_email, validate_phone, format_phone
+from ..utils.timezone_utils import make_timestamp_formatter
 
+# Columns whose values are converted to the display timezone
+TIMESTAMP_COLUMNS = ('created_at', 'updated_at')
 
-def display_contacts_dynamic(contacts: List[tuple], detailed: bool = False):
-    """Display contacts dynamically based on current schema."""
-    if not contacts:
-        print("📭 No contacts found!")
-        return
+# Rows pulled from the source per rendering batch (each batch is written in one call)
+PAGE_SIZE = 100
+
+# Compact view widths for well-known columns; others use the layout's default width
+COLUMN_WIDTHS = {
+    'id': 5,
+    'name': 20,
+    'phone': 15,
+    'email': 50,  # Extra wide for long email addresses
+    'created_at': 25,  # Enough for "2025-10-02 08:15:30 IST"
+    'updated_at': 25,
+}
+
+# Field-specific input checks: column -> (validator, error message, formatter)
+_VALIDATORS = {
+    'email': (validate_email,
+              "❌ Invalid email format. Please enter a valid email (e.g., user@example.com).",
+              None),
+    'phone': (validate_phone,
+              "❌ Invalid phone number. Enter 7-15 digits; separators are allowed.",
+              format_phone),  # Format phone consistently
+}
+
+
+@lru_cache(maxsize=32)
+def _sep(ch: str, n: int) -> str:
+    """Return a separator line of n characters, reusing previously built ones."""
+    return ch * n
+
+
+def _make_row_getter(table_columns: List[str], columns: List[str]):
+    """Build a callable returning a row's values in display column order."""
+    positions = [table_columns.index(col) for col in columns]
+    if len(positions) == 1:
+        position = positions[0]
+        return lambda row: (row[position],)
+    return itemgetter(*positions)
+
+
+@dataclass(frozen=True)
+class _ColumnLayout:
+    """Display layout derived from a table schema, shared by the contact list views."""
+    columns: Tuple[str, ...]
+    widths: Tuple[int, ...]
+    total_width: int
+    row_format: str
+    pad_format: str
+    row_width: int
+    get_row: Callable
+    timestamp_positions: Tuple[int, ...]
     
-    columns = schema_manager.get_display_columns()
+    def iter_row_values(self, contacts: Iterable, format_timestamp: Optional[Callable] = None) -> Iterator:
+        """Return each contact's values in display order, picking the loop once per batch.
+        
+        Rows of one query share a width, so padding and timestamp formatting
+        are decided for the whole batch instead of being checked on every row.
+        """
+        rows = contacts if isinstance(contacts, (list, tuple)) else list(contacts)
+        row_width = self.row_width
+        if rows and min(map(len, rows)) < row_width:
+            # Rows predating a schema change: pad them to the current width
+            padding = (None,) * row_width
+            rows = [tuple(contact) + padding[len(contact):] for contact in rows]
+        values = map(self.get_row, rows)
+        if not self.timestamp_positions or format_timestamp is None:
+            return values
+        return self._format_timestamps(values, format_timestamp)
     
+    def _format_timestamps(self, rows: Iterator, format_timestamp: Callable) -> Iterator[List[Any]]:
+        """Yield each row's values with its timestamp columns formatted."""
+        timestamp_positions = self.timestamp_positions
+        for values in rows:
+            values = list(values)
+            for i in timestamp_positions:
+                value = values[i]
+                if value is not None:
+                    values[i] = format_timestamp(value)
+            yield values
+
+
+@lru_cache(maxsize=16)
+def _layout(table_columns: Tuple[str, ...], default_width: int = 15) -> Optional[_ColumnLayout]:
+    """Compute the display layout for a schema.
+    
+    Cached on the table's column tuple, so the layout is rebuilt only when
+    the schema actually changes.
+    """
+    columns = tuple(schema_manager.get_display_columns(list(table_columns)))
     if not columns:
+        return None
+    widths = tuple(COLUMN_WIDTHS.get(col, default_width) for col in columns)
+    return _ColumnLayout(
+        columns=columns,
+        widths=widths,
+        total_width=sum(widths) + len(widths) - 1,
+        # Pads and truncates every cell to its column width in a single format call
+        row_format=' '.join(f"{{:<{width}.{width}}}" for width in widths),
+        # Pads (without truncating) every cell; %-formatting parses the template once per call
+        pad_format=''.join(f"%-{width}s " for width in widths),
+        row_width=len(table_columns),
+        get_row=_make_row_getter(list(table_columns), list(columns)),
+        timestamp_positions=tuple(i for i, col in enumerate(columns) if col in TIMESTAMP_COLUMNS),
+    )
+
+
+def _pages(rows: Iterator[tuple], page_size: int) -> Iterator[List[tuple]]:
+    """Split rows into lists of at most page_size items."""
+    while True:
+        page = list(islice(rows, page_size))
+        if not page:
+            return
+        yield page
+
+
+def display_contacts_dynamic(contacts: Iterable[tuple], detailed: bool = False,
+                             page_size: int = PAGE_SIZE) -> int:
+    """Display contacts dynamically based on current schema.
+    
+    Accepts any iterable of rows, including a streaming search cursor, and
+    consumes it page_size rows at a time. Returns the number of contacts shown.
+    """
+    rows = iter(contacts)
+    first = next(rows, None)
+    if first is None:
+        print("📭 No contacts found!")
+        return 0
+    rows = chain((first,), rows)
+    
+    # Resolve the schema once per render rather than once per row
+    layout = _layout(tuple(schema_manager.get_table_columns()))
+    
+    if layout is None:
         print("❌ Unable to determine table structure")
-        return
+        return 0
+    
+    count = 0
+    
+    columns = layout.columns
+    # Bind the display timezone once for the whole page
+    format_timestamp = make_timestamp_formatter() if layout.timestamp_positions else None
+    
+    write = sys.stdout.write
     
     if detailed:
         # Detailed view - one contact per block
-        print("\n📋 Detailed Contact List:")
-        print("=" * 80)
+        write("\n📋 Detailed Contact List:\n" + _sep("=", 80) + "\n")
         
-        for contact in contacts:
-            contact_dict = schema_manager.get_contact_as_dict(contact)
-            
-            # Display ID prominently
-            contact_id = contact_dict.get('id', 'N/A')
-            print(f"\n📇 Contact #{contact_id}")
-            
-            # Display all other fields
-            for col in columns:
-                if col != 'id':  # Skip ID since we already showed it
-                    value = contact_dict.get(col, '')
-                    display_value = value if value not in [None, ''] else '(not provided)'
-                    # Capitalize column name for display
-                    col_display = col.replace('_', ' ').title()
-                    print(f"   {col_display:<15} {display_value}")
-            
-            print("-" * 80)
+        id_position = columns.index('id') if 'id' in columns else None
+        # Capitalize column names for display, skipping ID since it is shown in the heading
+        labels = [(i, f"   {col.replace('_', ' ').title():<15} ") for i, col in enumerate(columns) if col != 'id']
+        separator = _sep("-", 80)
+        
+        for page in _pages(rows, page_size):
+            lines = []
+            append = lines.append
+            for values in layout.iter_row_values(page, format_timestamp):
+                # Display ID prominently
+                contact_id = values[id_position] if id_position is not None else 'N/A'
+                append(f"\n📇 Contact #{contact_id}")
+                
+                # Display all other fields
+                for i, label in labels:
+                    value = values[i]
+                    append(f"{label}{value if value is not None and value != '' else '(not provided)'}")
+                
+                append(separator)
+            write("\n".join(lines) + "\n")
+            count += len(page)
     else:
         # Compact view - show all columns (up to 6)
-        display_cols = columns
-        
-        # Calculate column widths dynamically
-        col_widths = {}
-        for col in display_cols:
-            if col == 'id':
-                col_widths[col] = 5
-            elif col == 'name':
-                col_widths[col] = 20
-            elif col == 'phone':
-                col_widths[col] = 15
-            elif col == 'email':
-                col_widths[col] = 50  # Extra wide for long email addresses
-            elif col in ['created_at', 'updated_at']:
-                col_widths[col] = 25  # Enough for "2025-10-02 08:15:30 IST"
-            else:
-                col_widths[col] = 15
+        total_width = layout.total_width
+        row_format = layout.row_format
         
         # Print header
-        print("\n📋 Contact List:")
-        total_width = sum(col_widths.values()) + len(display_cols) - 1
-        print("-" * total_width)
-        
-        header = ' '.join([col.upper()[:col_widths[col]].ljust(col_widths[col]) 
-                          for col in display_cols])
-        print(header)
-        print("-" * total_width)
+        separator = _sep("-", total_width)
+        write(f"\n📋 Contact List:\n{separator}\n{row_format.format(*[col.upper() for col in columns])}\n{separator}\n")
         
         # Print contacts
-        for contact in contacts:
-            contact_dict = schema_manager.get_contact_as_dict(contact)
-            row = []
-            for col in display_cols:
-                value = str(contact_dict.get(col, ''))
-                if not value or value == 'None':
-                    value = ''
-                row.append(value[:col_widths[col]].ljust(col_widths[col]))
-            print(' '.join(row))
+        format_row = row_format.format
+        for page in _pages(rows, page_size):
+            lines = []
+            lines.extend(
+                format_row(*['' if value is None else str(value) for value in values])
+                for values in layout.iter_row_values(page, format_timestamp)
+            )
+            write("\n".join(lines) + "\n")
+            count += len(page)
         
         # Note: Now showing all columns in compact view
+    
+    return count
 
 
 def get_contact_input_dynamic(is_update: bool = False) -> Dict[str, Any]:
@@ -92,16 +215,19 @@ def get_contact_input_dynamic(is_update: bool = False) -> Dict[str, Any]:
     contact_data = {}
     
     print("\n📝 Enter Contact Information:")
-    print("=" * 50)
+    print(_sep("=", 50))
     print("(Type '0' to cancel, or '111' to exit at any time)")
     
+    # Build each field's prompt and checks once, before reading any input
+    fields = []
     for col in editable_columns:
-        # Format prompt
         col_display = col.replace('_', ' ').title()
         # Name is only required for new contacts, not updates
         is_required = (col == 'name') and not is_update
         prompt = f"{col_display}{'*' if is_required else ''}: "
-        
+        fields.append((col, col_display, prompt, is_required, _VALIDATORS.get(col)))
+    
+    for col, col_display, prompt, is_required, checks in fields:
         while True:
             value_raw = input(prompt).strip()
             
@@ -132,17 +258,13 @@ def get_contact_input_dynamic(is_update: bool = False) -> Dict[str, Any]:
                     break
             
             # Field-specific validation
-            if col == 'email' and value:
-                if not validate_email(value):
-                    print("❌ Invalid email format. Please enter a valid email (e.g., user@example.com).")
-                    continue
-            
-            if col == 'phone' and value:
-                if not validate_phone(value):
-                    print("❌ Invalid phone number. Enter 7-15 digits; separators are allowed.")
+            if checks and value:
+                validator, error_message, formatter = checks
+                if not validator(value):
+                    print(error_message)
                     continue
-                # Format phone consistently
-                value = format_phone(value)
+                if formatter:
+                    value = formatter(value)
             
             # Store the value (only if not empty or if it's a new contact)
             if value or not is_update:
@@ -157,7 +279,7 @@ def get_update_field_choice() -> str:
     editable_columns = schema_manager.get_editable_columns()
     
     print("\n✏️  Which field would you like to update?")
-    print("=" * 50)
+    print(_sep("=", 50))
     print("0. 🔙 Back to Previous Menu")
     print("111. 🚪 Exit Application")
     
@@ -186,12 +308,12 @@ def get_update_field_choice() -> str:
 def display_schema_info():
     """Display current database schema information."""
     print("\n🗄️  Current Database Schema")
-    print("=" * 80)
+    print(_sep("=", 80))
     
     columns_info = schema_manager.get_column_info()
     
     print(f"{'Column':<20} {'Type':<15} {'Nullable':<10} {'Default':<15}")
-    print("-" * 80)
+    print(_sep("-", 80))
     
     for col_info in columns_info:
         col_name = col_info.get('name', 'N/A')
@@ -214,10 +336,10 @@ def display_schema_info():
 def display_column_management_menu():
     """Display column management menu."""
     print("\n🛠️  Column Management")
-    print("=" * 50)
+    print(_sep("=", 50))
     print("1. View current schema")
     print("2. Add new column")
     print("3. Remove column")
     print("0. 🔙 Back to Previous Menu")
-    print("=" * 50)
+    print(_sep("=", 50))
 
@@ -3,11 +3,66 @@ UI Module - User Interface Functions
 Handles all display and formatting functions for the Contact Book Manager.
 """
 
+import io
+import sys
+from contextlib import contextmanager
+from functools import lru_cache
+from operator import itemgetter
+
 # Import from core operations to avoid circular dependencies
 from ..core.core_operations import (view_contacts, get_contact_by_id, search_contact, 
                             get_contact_analytics, get_database_stats, get_table_info,
-                            validate_email, validate_phone, format_phone, check_data_integrity)
+                            validate_email, validate_and_format_phone, check_data_integrity)
 from ..core.schema_manager import schema_manager
+from ..utils.timezone_utils import make_timestamp_formatter
+from .dynamic_ui import _layout
+
+# Separator lines, built once instead of on every render
+_SEP30 = "-" * 30
+_SEP60 = "-" * 60
+_SEP120 = "-" * 120
+_DOUBLE_SEP120 = "=" * 120
+
+# Fixed column headings, formatted once at import
+_TABLE_HEADER = f"{'Column':<15} {'Type':<15} {'Nullable':<10} {'Default':<15}"
+
+
+# Fields shown by display_contact_analytics, read in one call
+_ANALYTICS_FIELDS = itemgetter('total_contacts', 'contacts_with_phone', 'phone_percentage',
+                               'contacts_with_email', 'email_percentage',
+                               'complete_contacts', 'complete_percentage', 'top_email_domains')
+
+# Validation results are pure functions of the input, so repeated values are answered from cache
+_validate_email = lru_cache(maxsize=4096)(validate_email)
+_check_phone = lru_cache(maxsize=4096)(validate_and_format_phone)
+
+
+@lru_cache(maxsize=16)
+def _contact_header(layout):
+    """Build the compact contact list heading for a layout, once per schema."""
+    separator = "-" * (layout.total_width + 1)
+    heading = layout.pad_format % tuple(column.title() for column in layout.columns)
+    return f"{separator}\n{heading}\n{separator}"
+
+
+@contextmanager
+def _buffered_stdout():
+    """Collect everything printed inside the block and write it to stdout in one go.
+    
+    Also usable as a decorator. Only wrap output-only code: prompts printed
+    by input() inside the block would be held back too.
+    """
+    target = sys.stdout
+    buffer = io.StringIO()
+    sys.stdout = buffer
+    try:
+        yield
+    finally:
+        sys.stdout = target
+        target.write(buffer.getvalue())
+        target.flush()
+
+
 
 def display_contacts(contacts, detailed=False):
     """Display contacts in a formatted way.
@@ -20,113 +75,117 @@ def display_contacts(contacts, detailed=False):
         print("📭 No contacts found!")
         return
     
+    # Resolve the schema once; only the lookup itself touches the database
+    get_table_columns = getattr(schema_manager, 'get_table_columns', None)
+    try:
+        table_columns = get_table_columns() if get_table_columns else []
+    except Exception:
+        table_columns = []
+    layout = _layout(tuple(table_columns), default_width=12) if table_columns else None
+    
+    # Collect every line and write them in one call instead of one print per field
+    parts = []
+    append = parts.append
+    
     if detailed:
         # Detailed view - show all fields
-        print("\n📋 Detailed Contact List:")
-        print("=" * 120)
+        append("\n📋 Detailed Contact List:")
+        append(_DOUBLE_SEP120)
         
-        for i, contact in enumerate(contacts, 1):
-            # Use dynamic schema to map tuple to dict
-            try:
-                contact_dict = schema_manager.get_contact_as_dict(contact)
-                
-                print(f"\n📇 Contact #{contact_dict.get('id', 'N/A')}")
-                
-                # Display all columns dynamically (except id which is already shown)
-                columns = schema_manager.get_editable_columns()
-                for column in columns:
-                    value = contact_dict.get(column, '')
-                    display_name = column.replace('_', ' ').title()
-                    formatted_value = str(value) if value is not None else '(not provided)'
-                    print(f"   {display_name:<12}: {formatted_value}")
-                    
-            except Exception as e:
-                # Fallback to basic display if schema manager fails
-                contact_id = str(contact[0]) if contact[0] is not None else 'N/A'
-                print(f"\n📇 Contact #{contact_id}")
-                print(f"   Raw data: {contact}")
-            
-            if i < len(contacts):
-                print("-" * 120)
-    else:
-        # Compact view - show main fields dynamically
-        try:
-            columns = schema_manager.get_display_columns()
-            
-            print("\n📋 Contact List:")
+        last = len(contacts)
+        if layout is not None:
+            id_position = layout.columns.index('id') if 'id' in layout.columns else None
+            # Editable columns only (id is shown in the heading, timestamps are omitted);
+            # each label prefix is formatted once, not once per contact
+            labels = [(i, f"   {column.replace('_', ' ').title():<12}: ")
+                      for i, column in enumerate(layout.columns)
+                      if column not in ('id', 'created_at', 'updated_at')]
             
-            # Create dynamic header
-            header_line = ""
-            separator_length = 0
-            column_widths = {}
-            
-            # Calculate column widths and build header
-            for column in columns:
-                if column == 'id':
-                    width = 5
-                elif column in ['name']:
-                    width = 20
-                elif column == 'phone':
-                    width = 15
-                elif column == 'email':
-                    width = 50  # Extra wide for long email addresses
-                elif column in ['created_at', 'updated_at']:
-                    width = 25  # Enough for "2025-10-02 08:15:30 IST"
-                else:
-                    width = 12
+            for i, values in enumerate(layout.iter_row_values(contacts), 1):
+                contact_id = values[id_position] if id_position is not None else 'N/A'
+                append(f"\n📇 Contact #{contact_id}")
                 
-                column_widths[column] = width
-                separator_length += width + 1
-                header_line += f"{column.title():<{width}} "
-            
-            print("-" * separator_length)
-            print(header_line)
-            print("-" * separator_length)
-            
-            # Display contacts dynamically
-            for contact in contacts:
-                contact_dict = schema_manager.get_contact_as_dict(contact)
-                line = ""
-                for column in columns:
-                    value = str(contact_dict.get(column, '')) if contact_dict.get(column) is not None else ''
-                    width = column_widths[column]
-                    line += f"{value:<{width}} "
-                print(line)
+                # Display all columns dynamically (except id which is already shown)
+                for position, label in labels:
+                    value = values[position]
+                    append(label + (str(value) if value is not None else '(not provided)'))
                 
-        except Exception as e:
-            # Fallback to simple display
-            print("\n📋 Contact List:")
+                if i < last:
+                    append(_SEP120)
+        else:
+            # Fallback to basic display if the schema is unavailable
             for i, contact in enumerate(contacts, 1):
-                print(f"{i}. {contact}")
+                contact_id = str(contact[0]) if contact and contact[0] is not None else 'N/A'
+                append(f"\n📇 Contact #{contact_id}")
+                append(f"   Raw data: {contact}")
+                
+                if i < last:
+                    append(_SEP120)
+    elif layout is None:
+        # Fallback to simple display
+        append("\n📋 Contact List:")
+        for i, contact in enumerate(contacts, 1):
+            append(f"{i}. {contact}")
+    else:
+        # Compact view - show main fields dynamically
+        format_timestamp = make_timestamp_formatter() if layout.timestamp_positions else None
+        
+        append("\n📋 Contact List:")
+        
+        # Header is built once per schema; cells are padded by the layout's precompiled % template
+        pad_format = layout.pad_format
+        append(_contact_header(layout))
+        
+        # Display contacts dynamically, one padded line per row
+        parts.extend(
+            pad_format % tuple(['' if value is None else value for value in values])
+            for values in layout.iter_row_values(contacts, format_timestamp)
+        )
+    
+    sys.stdout.write("\n".join(parts) + "\n")
 
-def display_contact_analytics():
-    """Display contact analytics."""
+@_buffered_stdout()
+def display_contact_analytics(analytics=None):
+    """Display contact analytics.
+    
+    Args:
+        analytics: Precomputed analytics dict (fetched from the database if omitted)
+    """
     print("\n📈 Contact Analytics")
-    print("-" * 30)
+    print(_SEP30)
     
     try:
-        analytics = get_contact_analytics()
+        if analytics is None:
+            analytics = get_contact_analytics()
         
-        print(f"📊 Total Contacts: {analytics['total_contacts']}")
-        print(f"📞 Contacts with Phone: {analytics['contacts_with_phone']} ({analytics['phone_percentage']}%)")
-        print(f"📧 Contacts with Email: {analytics['contacts_with_email']} ({analytics['email_percentage']}%)")
-        print(f"✅ Complete Contacts: {analytics['complete_contacts']} ({analytics['complete_percentage']}%)")
+        (total, with_phone, phone_pct, with_email, email_pct,
+         complete, complete_pct, top_domains) = _ANALYTICS_FIELDS(analytics)
         
-        if analytics['top_email_domains']:
-            print("\n🌐 Top Email Domains:")
-            for domain, count in analytics['top_email_domains']:
-                print(f"   {domain}: {count} contacts")
+        print(f"📊 Total Contacts: {total}")
+        print(f"📞 Contacts with Phone: {with_phone} ({phone_pct}%)")
+        print(f"📧 Contacts with Email: {with_email} ({email_pct}%)")
+        print(f"✅ Complete Contacts: {complete} ({complete_pct}%)")
+        
+        if top_domains:
+            sys.stdout.write("\n🌐 Top Email Domains:\n"
+                             + "".join(f"   {domain}: {count} contacts\n" for domain, count in top_domains))
         
     except Exception as e:
         print(f"❌ Error getting analytics: {e}")
 
-def display_database_stats():
-    """Display database statistics."""
+@_buffered_stdout()
+def display_database_stats(stats=None):
+    """Display database statistics.
+    
+    Args:
+        stats: Precomputed statistics dict (fetched from the database if omitted)
+    """
     print("\n📊 Database Statistics")
-    print("-" * 30)
+    print(_SEP30)
     
     try:
-        stats = get_database_stats()
+        if stats is None:
+            stats = get_database_stats()
         
         # Handle different key names from different adapters
         record_count = stats.get('record_count', stats.get('contact_count', 0))
@@ -147,7 +206,6 @@ def display_database_stats():
         
         # Get column info separately if needed
         try:
-            from ..core.schema_manager import schema_manager
             columns = schema_manager.get_table_columns()
             print(f"🏗️  Total Columns: {len(columns)}")
             print(f"📋 Columns: {', '.join(columns)}")
@@ -157,10 +215,19 @@ def display_database_stats():
     except Exception as e:
         print(f"❌ Error getting database stats: {e}")
 
+@lru_cache(maxsize=8)
+def _table_structure_rows(columns):
+    """Format the table structure rows, once per distinct table info tuple."""
+    return "".join(
+        f"{str(col[1]):<15} {str(col[2]):<15} {'YES' if col[3] == 0 else 'NO':<10} {str(col[4]):<15}\n"
+        for col in columns
+    )
+
+@_buffered_stdout()
 def display_table_structure():
     """Display table structure."""
     print("\n🏗️  Table Structure")
-    print("-" * 30)
+    print(_SEP30)
     
     try:
         columns = get_table_info()
@@ -169,53 +236,53 @@ def display_table_structure():
             print("📭 No table structure found!")
             return
         
-        print(f"{'Column':<15} {'Type':<15} {'Nullable':<10} {'Default':<15}")
-        print("-" * 60)
+        print(_TABLE_HEADER)
+        print(_SEP60)
         
-        for col in columns:
-            col_name = col[1]
-            col_type = col[2]
-            nullable = "YES" if col[3] == 0 else "NO"
-            default = str(col[4]) if col[4] is not None else "None"
-            
-            print(f"{col_name:<15} {col_type:<15} {nullable:<10} {default:<15}")
+        sys.stdout.write(_table_structure_rows(tuple(map(tuple, columns))))
             
     except Exception as e:
         print(f"❌ Error getting table structure: {e}")
 
-def display_data_integrity_results():
-    """Display data integrity check results."""
+@_buffered_stdout()
+def display_data_integrity_results(issues=None):
+    """Display data integrity check results.
+    
+    Args:
+        issues: Precomputed list of issues (checked against the database if omitted)
+    """
     print("\n🔍 Data Integrity Check")
-    print("-" * 30)
+    print(_SEP30)
     
     try:
-        issues = check_data_integrity()
+        if issues is None:
+            issues = check_data_integrity()
         
         if not issues:
             print("✅ No data integrity issues found!")
         else:
             print("⚠️  Data integrity issues found:")
-            for i, issue in enumerate(issues, 1):
-                print(f"   {i}. {issue}")
+            sys.stdout.write("".join(f"   {i}. {issue}\n" for i, issue in enumerate(issues, 1)))
                 
     except Exception as e:
         print(f"❌ Error checking data integrity: {e}")
 
+@_buffered_stdout()
 def display_validation_results(email=None, phone=None):
     """Display data validation results."""
     print("\n✅ Data Validation")
-    print("-" * 30)
+    print(_SEP30)
     
     try:
         if email:
-            if validate_email(email):
+            if _validate_email(email):
                 print(f"✅ Email '{email}' is valid!")
             else:
                 print(f"❌ Email '{email}' is invalid!")
         
         if phone:
-            if validate_phone(phone):
-                formatted = format_phone(phone)
+            formatted = _check_phone(phone)
+            if formatted is not None:
                 print(f"✅ Phone '{phone}' is valid! Formatted: {formatted}")
             else:
                 print(f"❌ Phone '{phone}' is invalid!")
@@ -223,6 +290,7 @@ def display_validation_results(email=None, phone=None):
     except Exception as e:
         print(f"❌ Error in data validation: {e}")
 
+@_buffered_stdout()
 def display_search_results(results, search_term=""):
     """Display search results."""
     if not results:
@@ -261,41 +329,55 @@ def display_contact_preview(contact):
             'email': contact[3] if len(contact) > 3 else ''
         }
 
-    print(f"\n📇 Contact Details:")
+    # Build the whole preview and write it in one call
+    lines = ["\n📇 Contact Details:"]
     for col in columns:
         # Display ID first
         if col == 'id':
-            print(f"   ID:         {contact_dict.get('id', 'N/A')}")
+            lines.append(f"   ID:         {contact_dict.get('id', 'N/A')}")
             continue
         
         value = contact_dict.get(col)
-        display_value = value if value not in [None, ''] else '(not provided)'
+        display_value = value if value is not None and value != '' else '(not provided)'
         col_display = col.replace('_', ' ').title()
-        print(f"   {col_display}: {display_value}")
+        lines.append(f"   {col_display}: {display_value}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+# Status line prefixes shared by the display_* message helpers
+_PREFIXES = {
+    'success': "✅ ",
+    'error': "❌ ",
+    'warning': "⚠️  ",
+    'info': "ℹ️  ",
+}
+
+def _emit(level, message):
+    """Write one status line with the prefix for its level."""
+    sys.stdout.write(f"{_PREFIXES[level]}{message}\n")
 
 def display_operation_success(operation, count=None):
     """Display operation success message."""
     if count is not None:
-        print(f"✅ {operation} successful! ({count} items affected)")
+        _emit('success', f"{operation} successful! ({count} items affected)")
     else:
-        print(f"✅ {operation} successful!")
+        _emit('success', f"{operation} successful!")
 
 def display_operation_error(operation, error):
     """Display operation error message."""
-    print(f"❌ Error in {operation}: {error}")
+    _emit('error', f"Error in {operation}: {error}")
 
 def display_warning(message):
     """Display warning message."""
-    print(f"⚠️  {message}")
+    _emit('warning', message)
 
 def display_info(message):
     """Display info message."""
-    print(f"ℹ️  {message}")
+    _emit('info', message)
 
 def display_success(message):
     """Display success message."""
-    print(f"✅ {message}")
+    _emit('success', message)
 
 def display_error(message):
     """Display error message."""
-    print(f"❌ {message}")
+    _emit('error', message)
@@ -2,6 +2,14 @@
 Utility modules for the Contact Manager application.
 """
 
-from .timezone_utils import format_timestamp_for_display, get_display_timezone, get_timezone_info
+from .normalization import (NORMALIZED_FIELDS, canonical_email, canonical_phone, collect_unstripped_values,
+                            normalize_contact_fields, normalize_field_value)
+from .timezone_utils import (format_timestamp_for_display, get_display_timezone, get_timezone_info,
+                             make_timestamp_formatter)
+from .prefetch import Prefetcher
+from .ttl_cache import TTLCache
 
-__all__ = ['format_timestamp_for_display', 'get_display_timezone', 'get_timezone_info']
+__all__ = ['format_timestamp_for_display', 'get_display_timezone', 'get_timezone_info',
+           'make_timestamp_formatter', 'NORMALIZED_FIELDS', 'canonical_email', 'canonical_phone',
+           'collect_unstripped_values', 'normalize_contact_fields', 'normalize_field_value', 'Prefetcher',
+           'TTLCache']
@@ -0,0 +1,52 @@
+"""
+Normalization helpers for contact fields that are matched exactly.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, List, Tuple
+
+# Fields whose surrounding whitespace is stripped before they are stored
+NORMALIZED_FIELDS = ('email', 'phone')
+
+
+def normalize_field_value(field: str, value: Any) -> Any:
+    """Return the stored form of a single field value (email/phone are stripped)."""
+    if field in NORMALIZED_FIELDS and isinstance(value, str):
+        return value.strip()
+    return value
+
+
+def normalize_contact_fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of contact fields with email/phone in their stored form."""
+    return {field: normalize_field_value(field, value) for field, value in fields.items()}
+
+
+def collect_unstripped_values(rows: Iterable[Tuple]) -> Dict[str, List[Tuple[str, Any]]]:
+    """Find stored values that differ from their normalized form.
+    
+    Args:
+        rows: (id, *NORMALIZED_FIELDS) tuples
+        
+    Returns:
+        Mapping of field -> [(stripped_value, contact_id), ...] for values needing an update
+    """
+    updates: Dict[str, List[Tuple[str, Any]]] = {field: [] for field in NORMALIZED_FIELDS}
+    for contact_id, *values in rows:
+        for field, value in zip(NORMALIZED_FIELDS, values):
+            if isinstance(value, str) and value != value.strip():
+                updates[field].append((value.strip(), contact_id))
+    return updates
+
+
+def canonical_email(email: str) -> str:
+    """Return the interned key used to compare emails case-insensitively.
+    
+    Uses str.lower() rather than casefold() so in-memory comparisons agree
+    with the databases' LOWER(email) lookups ('ß' stays distinct from 'ss').
+    """
+    return sys.intern(email.strip().lower())
+
+
+def canonical_phone(phone: str) -> str:
+    """Return the interned key used to compare phone numbers."""
+    return sys.intern(phone.strip())
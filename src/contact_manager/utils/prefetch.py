@@ -0,0 +1,76 @@
+"""
+Background loading of results a menu is likely to show next.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+# Seconds to wait for a prefetched result before the caller queries directly
+PREFETCH_TIMEOUT = 10
+
+
+def _failed(future: Future) -> bool:
+    """Return True if future finished without a result (cancelled or raised)."""
+    return future.done() and (future.cancelled() or future.exception() is not None)
+
+
+class Prefetcher:
+    """Run a loader in the background so its result is ready when the user asks for it.
+
+    At most one load is pending at a time, and a finished load is kept until
+    it is taken or outdated. Loads run in daemon threads, so a slow query
+    never holds up interpreter exit. An optional version callable (e.g. the
+    database's data version) discards results loaded before a change.
+    """
+
+    def __init__(self, loader: Callable[[], Any], name: str, timeout: float = PREFETCH_TIMEOUT,
+                 version: Optional[Callable[[], Any]] = None):
+        """Create a prefetcher for loader; name labels its background threads."""
+        self.loader = loader
+        self.name = name
+        self.timeout = timeout
+        self.version = version
+        self._future: Optional[Future] = None
+        self._started_version: Any = None
+        self._lock = threading.Lock()
+
+    def _current_version(self) -> Any:
+        """Return the version token for data loaded now (None without a version callable)."""
+        return self.version() if self.version is not None else None
+
+    def start(self) -> None:
+        """Start a background load unless one for the current version is pending or ready.
+
+        A load is only restarted when the version changed or the previous load failed.
+        """
+        version = self._current_version()
+        with self._lock:
+            future = self._future
+            if future is not None and self._started_version == version and not _failed(future):
+                return
+            future = self._future = Future()
+            self._started_version = version
+        threading.Thread(target=self._run, args=(future,), name=self.name, daemon=True).start()
+
+    def _run(self, future: Future) -> None:
+        """Resolve future with the loader's result or exception."""
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(self.loader())
+        except BaseException as e:
+            future.set_exception(e)
+
+    def result(self) -> Any:
+        """Take the prefetched result, or None if nothing was prefetched or the load failed or timed out."""
+        with self._lock:
+            future, self._future = self._future, None
+            started_version = self._started_version
+        if future is None or started_version != self._current_version():
+            return None
+        try:
+            return future.result(timeout=self.timeout)
+        except Exception:
+            # Timed out or failed; callers query directly and report errors themselves
+            return None
@@ -3,31 +3,56 @@ Timezone utilities for displaying timestamps in the configured timezone.
 """
 
 import os
-from datetime import datetime
-from typing import Optional, Union
-import pytz
+import re
+import sys
+from datetime import datetime, timezone, tzinfo
+from functools import lru_cache, partial
+from typing import Callable, Optional, Union
 
+try:
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+except ImportError:  # Python < 3.9
+    from backports.zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-def get_display_timezone() -> pytz.BaseTzInfo:
-    """Get the configured display timezone."""
-    timezone_name = os.getenv('DISPLAY_TIMEZONE', 'Asia/Kolkata')
+DEFAULT_TIMEZONE = 'Asia/Kolkata'
+DISPLAY_FORMAT = '%Y-%m-%d %H:%M:%S %Z'
+
+# Space-separated timestamps as returned by MySQL/PostgreSQL (pre-3.11 parsing only)
+_SQL_TIMESTAMP_RE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}(\.\d+)?$')
+
+
+@lru_cache(maxsize=8)
+def _load_timezone(timezone_name: str) -> tzinfo:
+    """Load a timezone by name, caching the result."""
     try:
-        return pytz.timezone(timezone_name)
-    except pytz.UnknownTimeZoneError:
+        return ZoneInfo(timezone_name)
+    except (ZoneInfoNotFoundError, ValueError):
         # Fallback to Asia/Kolkata if invalid timezone
-        return pytz.timezone('Asia/Kolkata')
+        return ZoneInfo(DEFAULT_TIMEZONE)
 
 
-def format_timestamp_for_display(timestamp: Union[str, datetime, None]) -> str:
-    """
-    Format a timestamp for display in the configured timezone.
-    
-    Args:
-        timestamp: The timestamp to format (string, datetime, or None)
-        
-    Returns:
-        Formatted timestamp string in the display timezone
-    """
+def get_display_timezone(timezone_name: Optional[str] = None) -> tzinfo:
+    """Get the configured display timezone."""
+    return _load_timezone(timezone_name or os.getenv('DISPLAY_TIMEZONE', DEFAULT_TIMEZONE))
+
+
+def _legacy_parse_timestamp(timestamp: str) -> datetime:
+    """Parse a timestamp string on Python versions whose fromisoformat is strict."""
+    match = _SQL_TIMESTAMP_RE.match(timestamp)
+    if match:
+        # MySQL/PostgreSQL format with or without microseconds
+        fmt = '%Y-%m-%d %H:%M:%S.%f' if match.group(1) else '%Y-%m-%d %H:%M:%S'
+        return datetime.strptime(timestamp, fmt)
+    # ISO format: 2025-10-02T08:15:30
+    return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+
+# Python 3.11+ parses 'Z' suffixes, space separators and any fractional precision natively
+_parse_timestamp = datetime.fromisoformat if sys.version_info >= (3, 11) else _legacy_parse_timestamp
+
+
+def _format_timestamp(timestamp: Union[str, datetime, None], display_tz: tzinfo) -> str:
+    """Format a timestamp for display in the given timezone."""
     if timestamp is None:
         return '(not set)'
     
@@ -37,21 +62,7 @@ def format_timestamp_for_display(timestamp: Union[str, datetime, None]) -> str:
         
         # Try to parse the string timestamp
         try:
-            # Handle different timestamp formats
-            if 'T' in timestamp:
-                # ISO format: 2025-10-02T08:15:30
-                dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            elif ' ' in timestamp:
-                # MySQL/PostgreSQL format with or without microseconds
-                if '.' in timestamp:
-                    # With microseconds: 2025-10-02 08:15:30.123456
-                    dt = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S.%f')
-                else:
-                    # Without microseconds: 2025-10-02 08:15:30
-                    dt = datetime.strptime(timestamp, '%Y-%m-%d %H:%M:%S')
-            else:
-                # Other formats
-                dt = datetime.fromisoformat(timestamp)
+            dt = _parse_timestamp(timestamp)
         except (ValueError, TypeError):
             # If parsing fails, return the original string
             return str(timestamp)
@@ -60,18 +71,41 @@ def format_timestamp_for_display(timestamp: Union[str, datetime, None]) -> str:
     else:
         return str(timestamp)
     
-    # Get the display timezone
-    display_tz = get_display_timezone()
-    
     # If datetime is naive (no timezone info), assume it's UTC
     if dt.tzinfo is None:
-        dt = pytz.UTC.localize(dt)
+        dt = dt.replace(tzinfo=timezone.utc)
+    
+    # Convert to display timezone and format for display
+    return dt.astimezone(display_tz).strftime(DISPLAY_FORMAT)
+
+
+def make_timestamp_formatter(display_tz: Optional[tzinfo] = None) -> Callable[[Union[str, datetime, None]], str]:
+    """
+    Build a timestamp formatter bound to a display timezone.
     
-    # Convert to display timezone
-    local_dt = dt.astimezone(display_tz)
+    Use this when formatting many timestamps at once (e.g. rendering a contact
+    table) so the timezone is resolved once instead of once per value.
     
-    # Format for display
-    return local_dt.strftime('%Y-%m-%d %H:%M:%S %Z')
+    Args:
+        display_tz: Timezone to convert to (the configured display timezone if omitted)
+        
+    Returns:
+        Callable taking a timestamp and returning its display string
+    """
+    return partial(_format_timestamp, display_tz=display_tz or get_display_timezone())
+
+
+def format_timestamp_for_display(timestamp: Union[str, datetime, None]) -> str:
+    """
+    Format a timestamp for display in the configured timezone.
+    
+    Args:
+        timestamp: The timestamp to format (string, datetime, or None)
+        
+    Returns:
+        Formatted timestamp string in the display timezone
+    """
+    return _format_timestamp(timestamp, get_display_timezone())
 
 
 def get_current_timestamp_for_display() -> str:
@@ -0,0 +1,42 @@
+"""
+Small time-bounded cache for results that are expensive to recompute.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Cache loader results by key for a fixed number of seconds.
+
+    An optional version token is stored with each entry; a lookup with a
+    different version reloads, which lets callers tie entries to data changes.
+    """
+
+    def __init__(self, ttl: float):
+        """Create a cache whose entries expire after ttl seconds."""
+        self.ttl = ttl
+        self._entries: Dict[Hashable, Tuple[Any, float, Any]] = {}  # key -> (version, stored_at, value)
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, loader: Callable[[], Any], version: Any = None) -> Any:
+        """Return the cached value for key, calling loader if missing, stale or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[0] == version and now - entry[1] < self.ttl:
+            return entry[2]
+
+        value = loader()
+        with self._lock:
+            self._entries[key] = (version, now, value)
+        return value
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one entry, or every entry when key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
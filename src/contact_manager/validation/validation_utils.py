@@ -3,13 +3,105 @@ Validation Utilities Module
 Provides validation functions for contact data including uniqueness checks.
 """
 
-from typing import Dict, Any, Optional, Tuple
+from operator import itemgetter
+from typing import Callable, Dict, Any, Optional, Tuple
 from ..database.manager import db_manager
 from ..core.schema_manager import schema_manager
+from ..utils.normalization import canonical_email, canonical_phone
+
+# Fewest digits a phone number can have and still be valid (see DataValidator.validate_phone)
+MIN_PHONE_DIGITS = 7
+
+
+def _is_plausible_email(email: str) -> bool:
+    """Cheap shape check: a well-formed email has exactly one '@'."""
+    return email.count('@') == 1
+
+
+def _is_plausible_phone(phone: str) -> bool:
+    """Cheap shape check: a valid phone number has at least MIN_PHONE_DIGITS digits."""
+    return sum(char.isdigit() for char in phone) >= MIN_PHONE_DIGITS
 
 class ContactValidator:
     """Validates contact data for uniqueness and format."""
     
+    # (columns, getter) for the schema last seen; rebuilt when the columns change
+    _col_idx: Optional[Tuple[Tuple[str, ...], Callable[[Tuple], Tuple]]] = None
+    
+    @staticmethod
+    def _id_email_phone_getter() -> Callable[[Tuple], Tuple]:
+        """
+        Return a getter pulling (id, email, phone) out of a contact tuple by position.
+        
+        Positions are looked up once per schema instead of building a dict per row.
+        """
+        columns = tuple(schema_manager.get_table_columns())
+        cached = ContactValidator._col_idx
+        if cached is None or cached[0] != columns:
+            getter = itemgetter(columns.index('id'), columns.index('email'), columns.index('phone'))
+            ContactValidator._col_idx = cached = (columns, getter)
+        return cached[1]
+    
+    @staticmethod
+    def _scan_owner_ids(contacts, email: Optional[str], phone: Optional[str],
+                        exclude_id: Optional[int] = None) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Find the first contacts using an email (case-insensitive) and a phone number.
+        
+        Stored emails/phones are already stripped at write time. The scan
+        stops as soon as every requested value has an owner.
+        
+        Args:
+            contacts: Contact tuples to scan
+            email: Canonical email to look for (empty to skip)
+            phone: Canonical phone to look for (empty to skip)
+            exclude_id: Contact ID to ignore (for updates)
+            
+        Returns:
+            Tuple of (email_owner_id, phone_owner_id), None where unused
+        """
+        email_owner_id = phone_owner_id = None
+        need_email, need_phone = bool(email), bool(phone)
+        id_email_phone = ContactValidator._id_email_phone_getter()
+        for contact in contacts:
+            if not (need_email or need_phone):
+                break
+            contact_id, contact_email, contact_phone = id_email_phone(contact)
+            
+            # Skip if this is the same contact (for updates)
+            if exclude_id and contact_id == exclude_id:
+                continue
+            
+            if need_email and contact_email and contact_email.lower() == email:
+                email_owner_id, need_email = contact_id, False
+            
+            if need_phone and contact_phone == phone:
+                phone_owner_id, need_phone = contact_id, False
+        return email_owner_id, phone_owner_id
+    
+    @staticmethod
+    def _find_owner_ids(email: Optional[str], phone: Optional[str],
+                        exclude_id: Optional[int] = None) -> Tuple[Optional[int], Optional[int]]:
+        """
+        Find which contacts already use a normalized email and phone number.
+        
+        Uses the adapter's indexed lookups when available; otherwise scans
+        the cached contacts snapshot in memory. The email is expected as
+        canonical_email(), the form the adapters compare against LOWER(email).
+        
+        Returns:
+            Tuple of (email_owner_id, phone_owner_id), None where unused
+        """
+        adapter = db_manager.current_adapter
+        find_by_email = getattr(adapter, 'find_contact_by_email', None)
+        find_by_phone = getattr(adapter, 'find_contact_by_phone', None)
+        
+        if find_by_email and find_by_phone:
+            return (find_by_email(email, exclude_id) if email else None,
+                    find_by_phone(phone, exclude_id) if phone else None)
+        
+        return ContactValidator._scan_owner_ids(db_manager.get_contacts_snapshot(), email, phone, exclude_id)
+    
     @staticmethod
     def check_email_uniqueness(email: str, exclude_id: Optional[int] = None) -> Tuple[bool, str]:
         """
@@ -25,27 +117,22 @@ class ContactValidator:
         if not email or not email.strip():
             return True, "Email is empty"
         
-        email = email.strip().lower()
+        email = canonical_email(email)
+        
+        # Malformed emails can't match a stored one; skip the lookup entirely
+        if not _is_plausible_email(email):
+            return True, "Email format invalid, skipping uniqueness check"
         
+        # Only the lookup touches the database; that is all the try needs to cover
         try:
-            existing_contacts = db_manager.current_adapter.view_contacts()
-            
-            for contact in existing_contacts:
-                contact_dict = schema_manager.get_contact_as_dict(contact)
-                contact_id = contact_dict.get('id')
-                contact_email = contact_dict.get('email')
-                
-                # Skip if this is the same contact (for updates)
-                if exclude_id and contact_id == exclude_id:
-                    continue
-                
-                if contact_email and contact_email.strip().lower() == email:
-                    return False, f"Email '{email}' is already used by contact ID {contact_id}"
-            
-            return True, "Email is unique"
-            
-        except Exception as e:
+            owner_id, _ = ContactValidator._find_owner_ids(email, None, exclude_id)
+        except db_manager.db_errors as e:
             return False, f"Error checking email uniqueness: {str(e)}"
+        
+        if owner_id is not None:
+            return False, f"Email '{email}' is already used by contact ID {owner_id}"
+        
+        return True, "Email is unique"
     
     @staticmethod
     def check_phone_uniqueness(phone: str, exclude_id: Optional[int] = None) -> Tuple[bool, str]:
@@ -62,27 +149,21 @@ class ContactValidator:
         if not phone or not phone.strip():
             return True, "Phone is empty"
         
-        phone = phone.strip()
+        phone = canonical_phone(phone)
+        
+        # Too few digits to be a stored phone number; skip the lookup entirely
+        if not _is_plausible_phone(phone):
+            return True, "Phone format invalid, skipping uniqueness check"
         
         try:
-            existing_contacts = db_manager.current_adapter.view_contacts()
-            
-            for contact in existing_contacts:
-                contact_dict = schema_manager.get_contact_as_dict(contact)
-                contact_id = contact_dict.get('id')
-                contact_phone = contact_dict.get('phone')
-                
-                # Skip if this is the same contact (for updates)
-                if exclude_id and contact_id == exclude_id:
-                    continue
-                
-                if contact_phone and contact_phone.strip() == phone:
-                    return False, f"Phone '{phone}' is already used by contact ID {contact_id}"
-            
-            return True, "Phone is unique"
-            
-        except Exception as e:
+            _, owner_id = ContactValidator._find_owner_ids(None, phone, exclude_id)
+        except db_manager.db_errors as e:
             return False, f"Error checking phone uniqueness: {str(e)}"
+        
+        if owner_id is not None:
+            return False, f"Phone '{phone}' is already used by contact ID {owner_id}"
+        
+        return True, "Phone is unique"
     
     @staticmethod
     def validate_contact_uniqueness(email: str = None, phone: str = None, exclude_id: Optional[int] = None) -> Dict[str, Any]:
@@ -103,70 +184,84 @@ class ContactValidator:
             "warnings": []
         }
         
+        email = canonical_email(email) if email and email.strip() else None
+        phone = canonical_phone(phone) if phone and phone.strip() else None
+        
+        # Malformed values are left to format validation; only look up plausible ones
+        if email and not _is_plausible_email(email):
+            email = None
+        if phone and not _is_plausible_phone(phone):
+            phone = None
+        if not email and not phone:
+            return results
+        
+        try:
+            email_owner_id, phone_owner_id = ContactValidator._find_owner_ids(email, phone, exclude_id)
+        except db_manager.db_errors as e:
+            results["valid"] = False
+            if email:
+                results["errors"].append(f"Email: Error checking email uniqueness: {str(e)}")
+            if phone:
+                results["errors"].append(f"Phone: Error checking phone uniqueness: {str(e)}")
+            return results
+        
         # Check email uniqueness
-        if email and email.strip():
-            email_unique, email_msg = ContactValidator.check_email_uniqueness(email, exclude_id)
-            if not email_unique:
-                results["valid"] = False
-                results["errors"].append(f"Email: {email_msg}")
+        if email_owner_id is not None:
+            results["valid"] = False
+            results["errors"].append(f"Email: Email '{email}' is already used by contact ID {email_owner_id}")
         
         # Check phone uniqueness
-        if phone and phone.strip():
-            phone_unique, phone_msg = ContactValidator.check_phone_uniqueness(phone, exclude_id)
-            if not phone_unique:
-                results["valid"] = False
-                results["errors"].append(f"Phone: {phone_msg}")
+        if phone_owner_id is not None:
+            results["valid"] = False
+            results["errors"].append(f"Phone: Phone '{phone}' is already used by contact ID {phone_owner_id}")
         
         return results
     
     @staticmethod
     def get_duplicate_statistics() -> Dict[str, Any]:
         """Get statistics about duplicate emails and phones in the database."""
+        # Only the fetch touches the database; the counting loop runs unguarded
         try:
-            existing_contacts = db_manager.current_adapter.view_contacts()
-            
-            emails = {}
-            phones = {}
-            total_contacts = len(existing_contacts)
-            
-            for contact in existing_contacts:
-                contact_dict = schema_manager.get_contact_as_dict(contact)
-                contact_id = contact_dict.get('id')
-                email = contact_dict.get('email')
-                phone = contact_dict.get('phone')
-                
-                # Track emails
-                if email and email.strip():
-                    email_key = email.strip().lower()
-                    if email_key not in emails:
-                        emails[email_key] = []
-                    emails[email_key].append(contact_id)
-                
-                # Track phones
-                if phone and phone.strip():
-                    phone_key = phone.strip()
-                    if phone_key not in phones:
-                        phones[phone_key] = []
-                    phones[phone_key].append(contact_id)
-            
-            # Find duplicates
-            duplicate_emails = {email: ids for email, ids in emails.items() if len(ids) > 1}
-            duplicate_phones = {phone: ids for phone, ids in phones.items() if len(ids) > 1}
-            
-            return {
-                "total_contacts": total_contacts,
-                "unique_emails": len(emails),
-                "unique_phones": len(phones),
-                "duplicate_emails": len(duplicate_emails),
-                "duplicate_phones": len(duplicate_phones),
-                "duplicate_email_details": duplicate_emails,
-                "duplicate_phone_details": duplicate_phones,
-                "database_clean": len(duplicate_emails) == 0 and len(duplicate_phones) == 0
-            }
-            
-        except Exception as e:
+            existing_contacts = db_manager.get_contacts_snapshot()
+            id_email_phone = ContactValidator._id_email_phone_getter()
+        except db_manager.db_errors as e:
             return {
                 "error": f"Could not analyze duplicates: {str(e)}",
                 "total_contacts": 0,
                 "database_clean": False
             }
+        
+        # First contact seen per value; a value only gets an ID list once it repeats
+        first_email_id = {}
+        first_phone_id = {}
+        duplicate_emails = {}
+        duplicate_phones = {}
+        total_contacts = len(existing_contacts)
+        
+        for contact in existing_contacts:
+            contact_id, email, phone = id_email_phone(contact)
+            
+            # Track emails
+            if email:
+                email_key = canonical_email(email)
+                first_id = first_email_id.setdefault(email_key, contact_id)
+                if first_id != contact_id:
+                    duplicate_emails.setdefault(email_key, [first_id]).append(contact_id)
+            
+            # Track phones
+            if phone:
+                phone_key = canonical_phone(phone)
+                first_id = first_phone_id.setdefault(phone_key, contact_id)
+                if first_id != contact_id:
+                    duplicate_phones.setdefault(phone_key, [first_id]).append(contact_id)
+        
+        return {
+            "total_contacts": total_contacts,
+            "unique_emails": len(first_email_id),
+            "unique_phones": len(first_phone_id),
+            "duplicate_emails": len(duplicate_emails),
+            "duplicate_phones": len(duplicate_phones),
+            "duplicate_email_details": duplicate_emails,
+            "duplicate_phone_details": duplicate_phones,
+            "database_clean": len(duplicate_emails) == 0 and len(duplicate_phones) == 0
+        }
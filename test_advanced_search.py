@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Regression tests for advanced search filters against a SQLite database
+"""
+
+import sys
+import os
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pytest
+
+from contact_manager.core.core_operations import advanced_search, iter_advanced_search
+
+
+@pytest.fixture
+def contacts(sqlite_db):
+    """Four contacts with ids 1-4; 'Bob' matches ids 1 and 3 by name, id 4 by email."""
+    sqlite_db.add_contacts_bulk([
+        {'name': 'Bob Smith', 'phone': '5550000001', 'email': 'bsmith@x.com'},
+        {'name': 'Alice Jones', 'phone': '5550000002', 'email': 'alice@x.com'},
+        {'name': 'Bob Brown', 'phone': '5550000003', 'email': 'brown@x.com'},
+        {'name': 'Carol White', 'phone': '5550000004', 'email': 'bob.fan@x.com'},
+    ])
+    return sqlite_db
+
+
+def _ids(rows):
+    return sorted(row[0] for row in rows)
+
+
+def test_text_filters_match_any_field(contacts):
+    """Text filters are OR'd: a contact matching any of them is returned."""
+    assert _ids(advanced_search({'name': 'Bob'})) == [1, 3]
+    assert _ids(advanced_search({'name': 'Bob', 'email': 'bob'})) == [1, 3, 4]
+    assert _ids(advanced_search({'phone': '0002', 'email': 'brown'})) == [2, 3]
+
+
+def test_id_range_filters(contacts):
+    """min_id and max_id are inclusive bounds, alone or together."""
+    assert _ids(advanced_search({'min_id': 2})) == [2, 3, 4]
+    assert _ids(advanced_search({'max_id': 2})) == [1, 2]
+    assert _ids(advanced_search({'min_id': 2, 'max_id': 3})) == [2, 3]
+
+
+def test_text_filters_and_id_range_are_combined_with_and(contacts):
+    """The ID range narrows the OR'd text matches instead of adding to them."""
+    assert _ids(advanced_search({'name': 'Bob', 'min_id': 2})) == [3]
+    assert _ids(advanced_search({'name': 'Bob', 'email': 'bob', 'max_id': 3})) == [1, 3]
+    assert _ids(advanced_search({'name': 'Alice', 'min_id': 3, 'max_id': 4})) == []
+    assert _ids(iter_advanced_search({'name': 'Bob', 'min_id': 2})) == [3]
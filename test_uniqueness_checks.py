@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Regression tests for email/phone uniqueness checks against a SQLite database
+"""
+
+import sys
+import os
+
+# Add src to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from contact_manager.database.manager import db_manager
+from contact_manager.validation.validation_utils import ContactValidator
+
+
+def test_non_ascii_email_duplicate_is_detected(sqlite_db):
+    """Emails differing only in the case of a non-ASCII letter are duplicates."""
+    sqlite_db.add_contact(name='Émile', email='Émile@x.com')
+
+    is_unique, _ = ContactValidator.check_email_uniqueness('émile@x.com')
+    assert not is_unique
+
+
+def test_email_duplicate_with_special_casefold_is_detected(sqlite_db):
+    """The lookup key must match LOWER(email), not a case-folded form ('ß' stays 'ß')."""
+    sqlite_db.add_contact(name='Straße', email='Straße@x.de')
+
+    is_unique, _ = ContactValidator.check_email_uniqueness('straße@x.de')
+    assert not is_unique
+    assert not ContactValidator.validate_contact_uniqueness(email='straße@x.de')['valid']
+    assert ContactValidator.check_email_uniqueness('strasse@x.de')[0]
+
+    # The duplicate statistics use the same equivalence as the lookups
+    db_manager.add_contact(name='Strasse', email='strasse@x.de')
+    db_manager.add_contact(name='Straße 2', email='straße@x.de')
+    stats = ContactValidator.get_duplicate_statistics()
+    assert stats['duplicate_email_details'] == {'straße@x.de': [1, 3]}
+
+
+def test_backfill_strips_tabs_and_newlines(sqlite_db):
+    """Legacy values with non-space whitespace are normalized and then found as duplicates."""
+    conn = sqlite_db.get_connection()
+    conn.execute("INSERT INTO contacts (name, phone, email) VALUES (?, ?, ?)",
+                 ('Legacy', '5557778888\t', 'legacy@x.com\n'))
+    conn.commit()
+    conn.close()
+
+    assert sqlite_db.normalize_stored_values() == 2
+
+    assert not ContactValidator.check_email_uniqueness('legacy@x.com')[0]
+    assert not ContactValidator.check_phone_uniqueness('5557778888')[0]
+    assert sqlite_db.normalize_stored_values() == 0
+
+
+def test_email_match_is_case_insensitive_but_accent_sensitive(sqlite_db):
+    """'JOSÉ@x.com' duplicates 'José@x.com'; 'jose@x.com' is a different address."""
+    sqlite_db.add_contact(name='José', email='José@x.com')
+
+    assert not ContactValidator.check_email_uniqueness('JOSÉ@x.com')[0]
+    assert ContactValidator.check_email_uniqueness('jose@x.com')[0]